@@ -66,6 +66,18 @@ INSTALLED_APPS = [
     'radius',
 ]
 
+# Scripts autonomes (scripts/users, scripts/database) : registre d'applications
+# réduit pour accélérer django.setup(). Les apps locales restent chargées car
+# les signaux de core importent radius et mikrotik.
+if env.bool('DJANGO_SCRIPT_MINIMAL', default=False):
+    INSTALLED_APPS = [
+        'django.contrib.auth',
+        'django.contrib.contenttypes',
+        'core',
+        'mikrotik',
+        'radius',
+    ]
+
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
     'corsheaders.middleware.CorsMiddleware',
@@ -237,6 +249,21 @@ CAPTIVE_PORTAL_CONFIG = {
 # Custom User Model
 AUTH_USER_MODEL = 'core.User'
 
+# =============================================================================
+# Cache Configuration
+# =============================================================================
+# Redis (REDIS_URL, fourni par docker-compose) : cache partagé par tous les
+# workers, indispensable pour que l'invalidation du statut admin en cache
+# (CachedIsAdminUser) soit vue partout. Sans REDIS_URL (dev, tests), chaque
+# processus garde son propre cache mémoire.
+if env('REDIS_URL', default=''):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': env('REDIS_URL'),
+        }
+    }
+
 # =============================================================================
 # Celery Configuration
 # =============================================================================
@@ -9,9 +9,14 @@ un modèle de sécurité cohérent entre:
 - API REST (viewsets.py)
 - Signals et services internes
 """
+from django.core.cache import cache
 from rest_framework import permissions
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
 from functools import wraps
+import hashlib
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -109,6 +114,80 @@ class CanCreateUsers(permissions.BasePermission):
         return True
 
 
+class CachedIsAdminUser(permissions.IsAdminUser):
+    """
+    IsAdminUser avec mise en cache du statut admin par access token.
+
+    Seules les requêtes en lecture (SAFE_METHODS) utilisent le cache : la
+    résolution de l'utilisateur (SELECT sur la table users) n'est faite qu'au
+    premier appel pour un token donné, les appels suivants lisent le statut
+    dans le cache jusqu'à l'expiration du token (max CACHE_TTL). Les écritures
+    vérifient toujours l'utilisateur en base.
+
+    La clé inclut un numéro de version par utilisateur, incrémenté à chaque
+    enregistrement ou suppression du User (signal dans core.signals) : une
+    révocation (is_active/is_staff/is_superuser) prend effet immédiatement.
+
+    La signature et l'expiration du token sont toujours vérifiées (sans
+    accès base). Les vues doivent différer l'authentification DRF via
+    LazyAuthenticationMixin, sinon request.user est résolu avant la
+    vérification des permissions et le cache n'évite aucune requête.
+    """
+    CACHE_TTL = 300  # 5 minutes
+    CACHE_PREFIX = 'auth:admin:'
+    VERSION_PREFIX = 'auth:admin:version:'
+
+    @classmethod
+    def invalidate_user(cls, user_id):
+        """Invalide le statut admin en cache pour tous les tokens de l'utilisateur"""
+        key = cls.VERSION_PREFIX + str(user_id)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, 1, timeout=None)
+
+    def has_permission(self, request, view):
+        if request.method not in permissions.SAFE_METHODS:
+            return super().has_permission(request, view)
+
+        jwt_auth = JWTAuthentication()
+        header = jwt_auth.get_header(request)
+        raw_token = jwt_auth.get_raw_token(header) if header else None
+        if raw_token is None:
+            return super().has_permission(request, view)
+
+        # Lève InvalidToken (401) si le token est invalide ou expiré
+        validated_token = jwt_auth.get_validated_token(raw_token)
+        user_id = validated_token.get(jwt_settings.USER_ID_CLAIM)
+        timeout = min(self.CACHE_TTL, int(validated_token['exp'] - time.time()))
+        if user_id is None or timeout <= 0:
+            return super().has_permission(request, view)
+
+        version = cache.get(self.VERSION_PREFIX + str(user_id), 0)
+        token_hash = hashlib.blake2b(raw_token, digest_size=16).hexdigest()
+        key = f"{self.CACHE_PREFIX}{user_id}:{version}:{token_hash}"
+        return cache.get_or_set(
+            key,
+            lambda: super(CachedIsAdminUser, self).has_permission(request, view),
+            timeout=timeout
+        )
+
+
+class LazyAuthenticationMixin:
+    """
+    Diffère l'authentification DRF jusqu'au premier accès à request.user.
+
+    Réservé aux vues protégées par CachedIsAdminUser : sur un cache hit, la
+    requête est servie sans résoudre l'utilisateur en base. Un token invalide
+    ou expiré est quand même rejeté en 401, car CachedIsAdminUser valide le
+    token avant toute lecture du cache ; sur un cache miss ou une écriture,
+    request.user est résolu et l'authentification DRF s'applique normalement.
+    """
+
+    def perform_authentication(self, request):
+        pass
+
+
 # =============================================================================
 # Permissions RADIUS (Fix #15)
 # =============================================================================
@@ -267,6 +346,8 @@ __all__ = [
     'CanCreateUsers',
     'CanManageRadius',
     'IsSuperuser',
+    'CachedIsAdminUser',
+    'LazyAuthenticationMixin',
     'check_admin_permission',
     'check_radius_permission',
     'require_radius_permission',
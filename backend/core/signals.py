@@ -25,6 +25,7 @@ import logging
 import traceback
 
 from .models import User, Profile, Promotion, ProfileHistory, UserProfileUsage, BlockedSite
+from .permissions import CachedIsAdminUser
 
 logger = logging.getLogger(__name__)
 
@@ -424,6 +425,20 @@ def remove_user_from_radius_and_mikrotik(sender, instance, **kwargs):
         set_syncing(False)
 
 
+# =============================================================================
+# Invalidation du cache des permissions admin
+# =============================================================================
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_cached_admin_status(sender, instance, **kwargs):
+    """
+    Révoque immédiatement le statut admin mis en cache par CachedIsAdminUser
+    pour tous les tokens de l'utilisateur (désactivation, retrait du rôle admin).
+    """
+    CachedIsAdminUser.invalidate_user(instance.pk)
+
+
 # =============================================================================
 # Profile Synchronization to RADIUS Groups (+ MikroTik optionnel) - Fix #7, #12
 # =============================================================================
@@ -620,3 +620,36 @@ class TestSyncFailureLog:
         result = log.schedule_retry()
         assert result is False
         assert log.status == 'failed'
+
+
+@pytest.mark.django_db
+class TestCleanTokensScript:
+    """Tests for scripts/users/clean_tokens.py raw token deletion."""
+
+    @pytest.fixture
+    def clean_tokens(self):
+        import importlib.util
+        from pathlib import Path
+        path = Path(__file__).resolve().parent.parent / 'scripts' / 'users' / 'clean_tokens.py'
+        spec = importlib.util.spec_from_file_location('clean_tokens', path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+
+    def test_delete_tokens_leaves_no_orphaned_blacklist_rows(self, clean_tokens, regular_user, admin_user):
+        """Blacklist rows of deleted tokens are removed, others are kept."""
+        from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+        from rest_framework_simplejwt.tokens import RefreshToken
+
+        RefreshToken.for_user(regular_user).blacklist()
+        RefreshToken.for_user(regular_user)
+        RefreshToken.for_user(admin_user).blacklist()
+
+        deleted = clean_tokens.delete_tokens(OutstandingToken.objects.filter(user=regular_user))
+
+        assert deleted == 2
+        assert not OutstandingToken.objects.filter(user=regular_user).exists()
+        assert not BlacklistedToken.objects.exclude(
+            token_id__in=OutstandingToken.objects.values('id')
+        ).exists()
+        assert BlacklistedToken.objects.filter(token__user=admin_user).count() == 1
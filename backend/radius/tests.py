@@ -3,7 +3,9 @@ Tests for the RADIUS application.
 Tests cover models, synchronization services, and signals.
 """
 import pytest
+from datetime import timedelta
 from django.contrib.auth import get_user_model
+from rest_framework_simplejwt.tokens import AccessToken
 
 from .models import (
     RadCheck, RadReply, RadUserGroup, RadGroupCheck, RadGroupReply,
@@ -205,6 +207,164 @@ class TestRadPostAuthModel:
         assert entry.reply == "Access-Reject"
 
 
+# =============================================================================
+# API TESTS
+# =============================================================================
+
+@pytest.mark.django_db
+class TestRadPostAuthAPI:
+    """Tests for the RadPostAuth admin endpoints."""
+
+    def test_recent_requires_admin(self, authenticated_client):
+        """Non-admin users are denied."""
+        response = authenticated_client.get('/api/radius/radpostauth/recent/')
+        assert response.status_code == 403
+
+    def test_admin_status_is_cached(self, admin_client, django_assert_num_queries):
+        """The admin lookup is only done on the first GET for a token."""
+        RadCheck.objects.create(username="cached", attribute="Cleartext-Password", value="pw")
+        assert admin_client.get('/api/radius/radcheck/').status_code == 200
+
+        # Cache hit (uncached endpoint): only the radcheck COUNT and page queries remain
+        with django_assert_num_queries(2):
+            response = admin_client.get('/api/radius/radcheck/')
+        assert response.status_code == 200
+
+    def test_recent_is_privately_cached_per_token(self, admin_client):
+        """Admin-only log responses must not be stored by shared caches."""
+        response = admin_client.get('/api/radius/radpostauth/recent/')
+        assert response.status_code == 200
+        assert 'private' in response['Cache-Control']
+        assert 'Authorization' in response['Vary']
+
+    def test_recent_repeat_poll_reads_newest_row_only(self, admin_client, django_assert_num_queries):
+        """A repeat poll only computes the ETag from the newest row, without a table aggregate."""
+        RadPostAuth.objects.create(username="polluser", reply="Access-Accept")
+        response = admin_client.get('/api/radius/radpostauth/recent/?limit=10')
+        assert response.status_code == 200
+        etag = response['ETag']
+
+        with django_assert_num_queries(1) as captured:
+            response = admin_client.get('/api/radius/radpostauth/recent/?limit=10', HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 304
+        sql = captured.captured_queries[0]['sql'].upper()
+        assert 'COUNT(' not in sql and 'LIMIT 1' in sql
+
+        # The ETag depends on the requested limit
+        response = admin_client.get('/api/radius/radpostauth/recent/?limit=20', HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+
+    def test_by_username_supports_conditional_get(self, admin_client):
+        """Polling with If-None-Match returns 304 until a new log arrives."""
+        RadPostAuth.objects.create(username="etaguser", reply="Access-Accept")
+        url = '/api/radius/radpostauth/by_username/?username=etaguser'
+        response = admin_client.get(url)
+        assert response.status_code == 200
+        assert response.has_header('ETag')
+        etag = response['ETag']
+
+        response = admin_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 304
+
+        RadPostAuth.objects.create(username="etaguser", reply="Access-Reject")
+        assert admin_client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+
+@pytest.mark.django_db
+class TestCachedAdminPermission:
+    """Tests for the per-token admin status cache on the RADIUS viewsets."""
+
+    def test_revoked_admin_is_denied_immediately(self, admin_client, admin_user):
+        """Saving the user invalidates the cached status for its tokens."""
+        assert admin_client.get('/api/radius/radcheck/').status_code == 200
+
+        admin_user.is_staff = False
+        admin_user.is_superuser = False
+        admin_user.save()
+
+        assert admin_client.get('/api/radius/radcheck/').status_code == 403
+        response = admin_client.post('/api/radius/radcheck/', {
+            'username': 'x', 'attribute': 'Cleartext-Password', 'op': ':=', 'value': 'pw'
+        })
+        assert response.status_code == 403
+
+    def test_invalid_token_is_rejected_on_cache_hit(self, admin_client, api_client, admin_user):
+        """A tampered or expired token still gets a 401 once the status is cached."""
+        assert admin_client.get('/api/radius/radcheck/').status_code == 200
+
+        token = api_client._credentials['HTTP_AUTHORIZATION']
+        api_client.credentials(HTTP_AUTHORIZATION=token[:-2] + ('AA' if token[-2:] != 'AA' else 'BB'))
+        assert api_client.get('/api/radius/radcheck/').status_code == 401
+
+        expired = AccessToken.for_user(admin_user)
+        expired.set_exp(lifetime=-timedelta(seconds=1))
+        api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {expired}')
+        assert api_client.get('/api/radius/radcheck/').status_code == 401
+
+
+@pytest.mark.django_db
+class TestRadiusUserAPI:
+    """Tests for the aggregated RADIUS user listing endpoints."""
+
+    @pytest.fixture
+    def radius_users(self):
+        RadCheck.objects.create(username="alice", attribute="Cleartext-Password", value="pw", statut=True)
+        RadReply.objects.create(username="alice", attribute="Session-Timeout", value="7200")
+        RadReply.objects.create(username="alice", attribute="Mikrotik-Rate-Limit", value="5M/10M")
+        RadUserGroup.objects.create(username="alice", groupname="profile_1_etudiant", priority=1)
+        RadCheck.objects.create(username="bob", attribute="Cleartext-Password", value="pw", statut=False)
+        RadCheck.objects.create(username="bob", attribute="Simultaneous-Use", value="1")
+
+    def test_list_aggregates_attributes(self, admin_client, radius_users):
+        """Each username appears once with its reply attributes and defaults."""
+        response = admin_client.get('/api/radius/users/')
+        assert response.status_code == 200
+        assert response.data['count'] == 2
+        assert response.data['results'] == [
+            {
+                'username': 'alice',
+                'groupname': 'profile_1_etudiant',
+                'session_timeout': 7200,
+                'bandwidth_limit': '5M/10M',
+                'is_enabled': True,
+            },
+            {
+                'username': 'bob',
+                'groupname': 'user',
+                'session_timeout': 3600,
+                'bandwidth_limit': '',
+                'is_enabled': False,
+            },
+        ]
+
+    def test_by_group(self, admin_client, radius_users):
+        """Only members of the requested group are returned."""
+        response = admin_client.get('/api/radius/users/by_group/', {'groupname': 'profile_1_etudiant'})
+        assert response.status_code == 200
+        assert response.data['results'] == [
+            {
+                'username': 'alice',
+                'groupname': 'profile_1_etudiant',
+                'session_timeout': 7200,
+                'is_enabled': True,
+            },
+        ]
+
+    def test_list_tolerates_invalid_session_timeout(self, admin_client, radius_users):
+        """A non-numeric Session-Timeout falls back to the default for that row only."""
+        RadReply.objects.filter(username="alice", attribute="Session-Timeout").update(value="8h")
+        response = admin_client.get('/api/radius/users/')
+        assert response.status_code == 200
+        assert [row['session_timeout'] for row in response.data['results']] == [3600, 3600]
+
+    def test_list_loads_attributes_for_page_only(self, admin_client, radius_users, django_assert_num_queries):
+        """Count and page of usernames, then one lookup per table restricted to the page."""
+        admin_client.get('/api/radius/users/')  # prime the permission cache
+        with django_assert_num_queries(5):
+            response = admin_client.get('/api/radius/users/', {'page_size': 1})
+        assert [row['username'] for row in response.data['results']] == ['alice']
+
+
 # =============================================================================
 # SIGNAL TESTS
 # =============================================================================
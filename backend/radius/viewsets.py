@@ -2,6 +2,11 @@ from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from django.db import transaction
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_control, cache_page
+from django.views.decorators.http import condition
+from django.views.decorators.vary import vary_on_headers
+from core.permissions import CachedIsAdminUser, LazyAuthenticationMixin
 from .models import (
     RadiusServer, RadiusAuthLog, RadiusAccounting, RadiusClient,
     RadCheck, RadReply, RadUserGroup, RadGroupCheck, RadGroupReply, RadPostAuth
@@ -16,10 +21,10 @@ from .serializers import (
 )
 
 
-class RadiusServerViewSet(viewsets.ModelViewSet):
+class RadiusServerViewSet(LazyAuthenticationMixin, viewsets.ModelViewSet):
     """ViewSet for RadiusServer model"""
     queryset = RadiusServer.objects.all()
-    permission_classes = [permissions.IsAdminUser]
+    permission_classes = [CachedIsAdminUser]
 
     def get_serializer_class(self):
         if self.action == 'list':
@@ -141,11 +146,11 @@ class RadiusAccountingViewSet(viewsets.ReadOnlyModelViewSet):
         return Response(stats)
 
 
-class RadiusClientViewSet(viewsets.ModelViewSet):
+class RadiusClientViewSet(LazyAuthenticationMixin, viewsets.ModelViewSet):
     """ViewSet for RadiusClient model"""
     queryset = RadiusClient.objects.all()
     serializer_class = RadiusClientSerializer
-    permission_classes = [permissions.IsAdminUser]
+    permission_classes = [CachedIsAdminUser]
 
     @action(detail=False, methods=['get'])
     def active(self, request):
@@ -159,22 +164,51 @@ class RadiusClientViewSet(viewsets.ModelViewSet):
 # FreeRADIUS User Management ViewSets
 # ============================================================================
 
-class RadiusUserViewSet(viewsets.ViewSet):
+def _session_timeout(value):
+    """Session-Timeout radreply en entier (3600 si absent ou non numérique)"""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 3600
+
+
+def _page_replies(usernames, attributes):
+    """{(username, attribute): value} des radreply de la page, en une requête"""
+    # Tri décroissant : en cas de doublon, la première entrée (id le plus petit) l'emporte
+    return {
+        (username, attribute): value
+        for username, attribute, value in RadReply.objects.filter(
+            username__in=usernames, attribute__in=attributes
+        ).order_by('-id').values_list('username', 'attribute', 'value')
+    }
+
+
+def _page_enabled(usernames):
+    """{username: statut} du mot de passe RADIUS des utilisateurs de la page"""
+    return dict(
+        RadCheck.objects.filter(
+            username__in=usernames, attribute='Cleartext-Password'
+        ).order_by('-id').values_list('username', 'statut')
+    )
+
+
+class RadiusUserViewSet(LazyAuthenticationMixin, viewsets.ViewSet):
     """
     ViewSet for managing complete RADIUS users
     Provides CRUD operations that handle radcheck, radreply, and radusergroup tables
     """
-    permission_classes = [permissions.IsAdminUser]
+    permission_classes = [CachedIsAdminUser]
 
     def list(self, request):
         """
         List all RADIUS users.
-        Optimisé pour éviter les N+1 queries en utilisant des dictionnaires de lookup.
+        Optimisé : pagination des usernames, puis une requête par table pour la page.
         """
         from rest_framework.pagination import PageNumberPagination
 
-        # Récupérer tous les usernames uniques
-        usernames = list(RadCheck.objects.values_list('username', flat=True).distinct())
+        # On pagine d'abord les usernames : les attributs ne sont ensuite
+        # chargés que pour la page (une requête par table, limitée par __in)
+        usernames = RadCheck.objects.values_list('username', flat=True).distinct().order_by('username')
 
         # Pagination
         paginator = PageNumberPagination()
@@ -182,73 +216,28 @@ class RadiusUserViewSet(viewsets.ViewSet):
         paginator.page_size_query_param = 'page_size'
         paginator.max_page_size = 200
 
-        # Paginer les usernames
         page_usernames = paginator.paginate_queryset(usernames, request)
 
         if not page_usernames:
             return paginator.get_paginated_response([])
 
-        # Créer des dictionnaires de lookup pour éviter les N+1 queries
-        # Une seule requête par table au lieu de N requêtes
-
-        # RadCheck passwords (filtrés par les usernames de la page)
-        password_checks = {
-            rc.username: rc for rc in
-            RadCheck.objects.filter(
-                username__in=page_usernames,
-                attribute='Cleartext-Password'
-            )
-        }
-
-        # Session timeouts
-        timeout_replies = {
-            rr.username: rr for rr in
-            RadReply.objects.filter(
-                username__in=page_usernames,
-                attribute='Session-Timeout'
-            )
-        }
-
-        # Bandwidth limits
-        bandwidth_replies = {
-            rr.username: rr for rr in
-            RadReply.objects.filter(
-                username__in=page_usernames,
-                attribute='Mikrotik-Rate-Limit'
-            )
-        }
-
-        # User groups
-        user_groups = {
-            rug.username: rug for rug in
+        groups = dict(
             RadUserGroup.objects.filter(username__in=page_usernames)
-        }
-
-        # Statuts des utilisateurs
-        statut_checks = {
-            rc.username: rc for rc in
-            RadCheck.objects.filter(
-                username__in=page_usernames,
-                attribute='Cleartext-Password'
-            )
-        }
-
-        # Construire la réponse en utilisant les dictionnaires
-        users_data = []
-        for username in page_usernames:
-            timeout_reply = timeout_replies.get(username)
-            bandwidth_reply = bandwidth_replies.get(username)
-            group = user_groups.get(username)
-            statut_check = statut_checks.get(username)
+            .order_by('-priority').values_list('username', 'groupname')
+        )
+        replies = _page_replies(page_usernames, ('Session-Timeout', 'Mikrotik-Rate-Limit'))
+        enabled = _page_enabled(page_usernames)
 
-            user_data = {
+        users_data = [
+            {
                 'username': username,
-                'groupname': group.groupname if group else 'user',
-                'session_timeout': int(timeout_reply.value) if timeout_reply else 3600,
-                'bandwidth_limit': bandwidth_reply.value if bandwidth_reply else '',
-                'is_enabled': statut_check.statut if statut_check else False
+                'groupname': groups.get(username, 'user'),
+                'session_timeout': _session_timeout(replies.get((username, 'Session-Timeout'))),
+                'bandwidth_limit': replies.get((username, 'Mikrotik-Rate-Limit'), ''),
+                'is_enabled': enabled.get(username, False),
             }
-            users_data.append(user_data)
+            for username in page_usernames
+        ]
 
         return paginator.get_paginated_response(users_data)
 
@@ -333,12 +322,14 @@ class RadiusUserViewSet(viewsets.ViewSet):
     def by_group(self, request):
         """
         Get all users in a specific group.
-        Optimisé pour éviter les N+1 queries.
+        Optimisé : pagination des usernames, puis une requête par table pour la page.
         """
         from rest_framework.pagination import PageNumberPagination
 
         groupname = request.query_params.get('groupname', 'user')
-        usernames = list(RadUserGroup.objects.filter(groupname=groupname).values_list('username', flat=True))
+        usernames = RadUserGroup.objects.filter(groupname=groupname).order_by('username').values_list(
+            'username', flat=True
+        )
 
         # Pagination
         paginator = PageNumberPagination()
@@ -351,89 +342,107 @@ class RadiusUserViewSet(viewsets.ViewSet):
         if not page_usernames:
             return paginator.get_paginated_response([])
 
-        # Lookup dictionnaires pour éviter N+1 queries
-        timeout_replies = {
-            rr.username: rr for rr in
-            RadReply.objects.filter(
-                username__in=page_usernames,
-                attribute='Session-Timeout'
-            )
-        }
-
-        statut_checks = {
-            rc.username: rc for rc in
-            RadCheck.objects.filter(
-                username__in=page_usernames,
-                attribute='Cleartext-Password'
-            )
-        }
-
-        users_data = []
-        for username in page_usernames:
-            timeout_reply = timeout_replies.get(username)
-            statut_check = statut_checks.get(username)
+        replies = _page_replies(page_usernames, ('Session-Timeout',))
+        enabled = _page_enabled(page_usernames)
 
-            user_data = {
+        users_data = [
+            {
                 'username': username,
                 'groupname': groupname,
-                'session_timeout': int(timeout_reply.value) if timeout_reply else 3600,
-                'is_enabled': statut_check.statut if statut_check else False
+                'session_timeout': _session_timeout(replies.get((username, 'Session-Timeout'))),
+                'is_enabled': enabled.get(username, False),
             }
-            users_data.append(user_data)
+            for username in page_usernames
+        ]
 
         return paginator.get_paginated_response(users_data)
 
 
-class RadCheckViewSet(viewsets.ModelViewSet):
+class RadCheckViewSet(LazyAuthenticationMixin, viewsets.ModelViewSet):
     """ViewSet for RadCheck model (direct access)"""
     queryset = RadCheck.objects.all()
     serializer_class = RadCheckSerializer
-    permission_classes = [permissions.IsAdminUser]
+    permission_classes = [CachedIsAdminUser]
 
 
-class RadReplyViewSet(viewsets.ModelViewSet):
+class RadReplyViewSet(LazyAuthenticationMixin, viewsets.ModelViewSet):
     """ViewSet for RadReply model (direct access)"""
     queryset = RadReply.objects.all()
     serializer_class = RadReplySerializer
-    permission_classes = [permissions.IsAdminUser]
+    permission_classes = [CachedIsAdminUser]
 
 
-class RadUserGroupViewSet(viewsets.ModelViewSet):
+class RadUserGroupViewSet(LazyAuthenticationMixin, viewsets.ModelViewSet):
     """ViewSet for RadUserGroup model (direct access)"""
     queryset = RadUserGroup.objects.all()
     serializer_class = RadUserGroupSerializer
-    permission_classes = [permissions.IsAdminUser]
+    permission_classes = [CachedIsAdminUser]
 
 
-class RadGroupCheckViewSet(viewsets.ModelViewSet):
+class RadGroupCheckViewSet(LazyAuthenticationMixin, viewsets.ModelViewSet):
     """ViewSet for RadGroupCheck model"""
     queryset = RadGroupCheck.objects.all()
     serializer_class = RadGroupCheckSerializer
-    permission_classes = [permissions.IsAdminUser]
+    permission_classes = [CachedIsAdminUser]
 
 
-class RadGroupReplyViewSet(viewsets.ModelViewSet):
+class RadGroupReplyViewSet(LazyAuthenticationMixin, viewsets.ModelViewSet):
     """ViewSet for RadGroupReply model"""
     queryset = RadGroupReply.objects.all()
     serializer_class = RadGroupReplySerializer
-    permission_classes = [permissions.IsAdminUser]
+    permission_classes = [CachedIsAdminUser]
+
+
+def _logs_etag(logs, *parts):
+    """ETag des logs RadPostAuth : id + authdate de la ligne la plus récente.
+
+    Lu via l'index sur authdate (une seule ligne), sans agrégat sur la table :
+    radpostauth grossit à chaque tentative d'authentification.
+    """
+    newest = logs.order_by('-authdate', '-id').values_list('id', 'authdate').first()
+    last = f"{newest[0]}-{newest[1].isoformat()}" if newest else ''
+    return '-'.join([last, *parts])
 
 
-class RadPostAuthViewSet(viewsets.ReadOnlyModelViewSet):
+def _recent_logs_etag(request, *args, **kwargs):
+    return _logs_etag(RadPostAuth.objects.all(), request.GET.get('limit', '100'))
+
+
+def _user_logs_etag(request, *args, **kwargs):
+    username = request.GET.get('username')
+    return _logs_etag(RadPostAuth.objects.filter(username=username)) if username else None
+
+
+class RadPostAuthViewSet(LazyAuthenticationMixin, viewsets.ReadOnlyModelViewSet):
     """ViewSet for RadPostAuth model (read-only authentication logs)"""
     queryset = RadPostAuth.objects.all()
     serializer_class = RadPostAuthSerializer
-    permission_classes = [permissions.IsAdminUser]
+    permission_classes = [CachedIsAdminUser]
+
+    # Les logs sont en lecture seule : le polling des dashboards est servi
+    # depuis le cache (la permission admin est vérifiée avant le cache).
+    # Réponses réservées aux admins : cache privé côté client, clé de cache
+    # serveur distincte par token, ETag calculé depuis le dernier authdate.
+    LOGS_CACHE_TTL = 15  # secondes
 
     @action(detail=False, methods=['get'])
+    @method_decorator(cache_control(private=True))
+    @method_decorator(condition(etag_func=_recent_logs_etag))
+    @method_decorator(cache_page(LOGS_CACHE_TTL))
+    @method_decorator(vary_on_headers('Authorization'))
     def recent(self, request):
         """Get recent authentication attempts"""
         limit = int(request.query_params.get('limit', 100))
-        logs = RadPostAuth.objects.all()[:limit]
+        # Tri explicite : le top-N est lu via l'index sur authdate (parcours inverse)
+        logs = RadPostAuth.objects.order_by('-authdate')[:limit]
         serializer = self.get_serializer(logs, many=True)
         return Response(serializer.data)
 
     @action(detail=False, methods=['get'])
+    @method_decorator(cache_control(private=True))
+    @method_decorator(condition(etag_func=_user_logs_etag))
+    @method_decorator(cache_page(LOGS_CACHE_TTL))
+    @method_decorator(vary_on_headers('Authorization'))
     def by_username(self, request):
         """Get authentication logs for a specific username"""
         username = request.query_params.get('username')
@@ -449,12 +458,12 @@ class RadPostAuthViewSet(viewsets.ReadOnlyModelViewSet):
 # MikroTik Integration ViewSet
 # ============================================================================
 
-class MikrotikIntegrationViewSet(viewsets.ViewSet):
+class MikrotikIntegrationViewSet(LazyAuthenticationMixin, viewsets.ViewSet):
     """
     ViewSet pour l'intégration MikroTik.
     Permet de récupérer et synchroniser les profils Hotspot.
     """
-    permission_classes = [permissions.IsAdminUser]
+    permission_classes = [CachedIsAdminUser]
 
     @action(detail=False, methods=['get'])
     def hotspot_profiles(self, request):
@@ -610,7 +619,7 @@ class MikrotikIntegrationViewSet(viewsets.ViewSet):
 # RADIUS Sync ViewSet - API pour la synchronisation depuis l'interface
 # ============================================================================
 
-class RadiusSyncViewSet(viewsets.ViewSet):
+class RadiusSyncViewSet(LazyAuthenticationMixin, viewsets.ViewSet):
     """
     ViewSet pour la synchronisation RADIUS depuis l'interface web.
 
@@ -622,7 +631,7 @@ class RadiusSyncViewSet(viewsets.ViewSet):
     - POST /api/radius/sync/full/                   → Synchronisation complète
     - GET  /api/radius/sync/status/                 → Statut de synchronisation
     """
-    permission_classes = [permissions.IsAdminUser]
+    permission_classes = [CachedIsAdminUser]
 
     @action(detail=False, methods=['post'], url_path='profile/(?P<profile_id>[^/.]+)/activate')
     def activate_profile(self, request, profile_id=None):
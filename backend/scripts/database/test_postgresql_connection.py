@@ -19,9 +19,8 @@ RESET = '\033[0m'
 
 def print_header(title):
     """Affiche un titre de section"""
-    print(f"\n{BLUE}{BOLD}{'='*70}{RESET}")
-    print(f"{BLUE}{BOLD}{title.center(70)}{RESET}")
-    print(f"{BLUE}{BOLD}{'='*70}{RESET}\n")
+    rule = f"{BLUE}{BOLD}{'='*70}{RESET}"
+    sys.stdout.write(f"\n{rule}\n{BLUE}{BOLD}{title.center(70)}{RESET}\n{rule}\n\n")
 
 def print_success(message):
     """Affiche un message de succès"""
@@ -83,24 +82,27 @@ def test_postgresql_connection():
     print_header("TEST DE CONNEXION")
 
     try:
-        # Tester la connexion
+        # Tester la connexion : version, base et utilisateur en un seul aller-retour
         with connection.cursor() as cursor:
-            # Version PostgreSQL
-            cursor.execute("SELECT version();")
-            version = cursor.fetchone()[0]
+            cursor.execute("SELECT version(), current_database(), current_user;")
+            version, db_name, current_user = cursor.fetchone()
             print_success("Connexion PostgreSQL établie!")
             print_info(f"Version: {version.split(',')[0]}")
-
-            # Nom de la base de données
-            cursor.execute("SELECT current_database();")
-            db_name = cursor.fetchone()[0]
             print_success(f"Base de données connectée: {db_name}")
-
-            # Utilisateur actuel
-            cursor.execute("SELECT current_user;")
-            current_user = cursor.fetchone()[0]
             print_success(f"Utilisateur connecté: {current_user}")
 
+            # Statistiques sur le même curseur : un échec ici n'est qu'un avertissement
+            # (pg_stat_activity / pg_database_size peuvent être restreints)
+            try:
+                cursor.execute("""
+                    SELECT pg_size_pretty(pg_database_size(current_database())),
+                           (SELECT count(*) FROM pg_stat_activity
+                            WHERE datname = current_database());
+                """)
+                db_stats = cursor.fetchone()
+            except Exception as e:
+                db_stats = e
+
     except Exception as e:
         print_error(f"Erreur de connexion: {e}")
         print()
@@ -120,24 +122,15 @@ def test_postgresql_connection():
     print_header("TABLES EXISTANTES")
 
     try:
-        with connection.cursor() as cursor:
-            cursor.execute("""
-                SELECT table_name
-                FROM information_schema.tables
-                WHERE table_schema = 'public'
-                ORDER BY table_name;
-            """)
-
-            tables = cursor.fetchall()
-
-            if tables:
-                print_success(f"Nombre de tables: {len(tables)}")
-                print()
-                for table in tables:
-                    print(f"  • {table[0]}")
-            else:
-                print_warning("Aucune table trouvée")
-                print_info("Exécutez 'python manage.py migrate' pour créer les tables")
+        # Introspection Django (pg_catalog) plutôt qu'information_schema
+        tables = connection.introspection.table_names()
+
+        if tables:
+            print_success(f"Nombre de tables: {len(tables)}")
+            sys.stdout.write("\n" + "".join(f"  • {table}\n" for table in tables))
+        else:
+            print_warning("Aucune table trouvée")
+            print_info("Exécutez 'python manage.py migrate' pour créer les tables")
 
     except Exception as e:
         print_error(f"Erreur lors de la récupération des tables: {e}")
@@ -178,26 +171,12 @@ def test_postgresql_connection():
     # Statistiques de la base de données
     print_header("STATISTIQUES BASE DE DONNÉES")
 
-    try:
-        with connection.cursor() as cursor:
-            # Taille de la base de données
-            cursor.execute("""
-                SELECT pg_size_pretty(pg_database_size(current_database()));
-            """)
-            db_size = cursor.fetchone()[0]
-            print_info(f"Taille de la base: {db_size}")
-
-            # Nombre de connexions actives
-            cursor.execute("""
-                SELECT count(*)
-                FROM pg_stat_activity
-                WHERE datname = current_database();
-            """)
-            active_connections = cursor.fetchone()[0]
-            print_info(f"Connexions actives: {active_connections}")
-
-    except Exception as e:
-        print_warning(f"Impossible de récupérer les statistiques: {e}")
+    if isinstance(db_stats, Exception):
+        print_warning(f"Impossible de récupérer les statistiques: {db_stats}")
+    else:
+        db_size, active_connections = db_stats
+        print_info(f"Taille de la base: {db_size}")
+        print_info(f"Connexions actives: {active_connections}")
 
     # Résumé final
     print_header("RÉSUMÉ")
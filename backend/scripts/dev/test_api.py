@@ -7,6 +7,16 @@ import requests
 import json
 from typing import Dict, Any, Optional
 
+# ijson (optionnel) pour parser les grosses réponses en streaming
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Au-delà de cette taille, les listes sont résumées au lieu d'être affichées
+LARGE_RESPONSE_BYTES = 1024 * 1024
+
 
 class CaptivePortalAPI:
     """Client pour tester l'API Captive Portal"""
@@ -35,6 +45,27 @@ class CaptivePortalAPI:
         except:
             print(f"Response: {response.text}")
 
+    def _get_list(self, name: str, url: str) -> Dict[str, Any]:
+        """GET d'une liste potentiellement volumineuse (données de production)"""
+        response = requests.get(url, headers=self._headers(), stream=True)
+        size = int(response.headers.get("Content-Length", 0))
+        if not (IJSON_AVAILABLE and response.ok and size > LARGE_RESPONSE_BYTES):
+            self._print_response(name, response)
+            return response.json() if response.ok else {}
+
+        # Parsing incrémental : mémoire constante, seul le nombre de lignes est affiché
+        response.raw.decode_content = True
+        count = sum(
+            1 for prefix, event, _ in ijson.parse(response.raw)
+            if event == "start_map" and prefix in ("item", "results.item")
+        )
+        print(f"\n{'='*60}")
+        print(f"Test: {name}")
+        print(f"{'='*60}")
+        print(f"Status Code: {response.status_code}")
+        print(f"Response: {count} élément(s), {size / 1024 / 1024:.1f} Mo (non affichée)")
+        return {}
+
     # Authentification
     def register(self, username: str, password: str, **kwargs) -> Dict[str, Any]:
         """Inscription d'un nouvel utilisateur"""
@@ -129,9 +160,7 @@ class CaptivePortalAPI:
     def list_sessions(self) -> Dict[str, Any]:
         """Lister les sessions"""
         url = f"{self.base_url}/api/core/sessions/"
-        response = requests.get(url, headers=self._headers())
-        self._print_response("List Sessions", response)
-        return response.json() if response.ok else {}
+        return self._get_list("List Sessions", url)
 
     def list_active_sessions(self) -> Dict[str, Any]:
         """Lister les sessions actives"""
@@ -151,9 +180,7 @@ class CaptivePortalAPI:
     def list_vouchers(self) -> Dict[str, Any]:
         """Lister les vouchers"""
         url = f"{self.base_url}/api/core/vouchers/"
-        response = requests.get(url, headers=self._headers())
-        self._print_response("List Vouchers", response)
-        return response.json() if response.ok else {}
+        return self._get_list("List Vouchers", url)
 
     def list_active_vouchers(self) -> Dict[str, Any]:
         """Lister les vouchers actifs"""
@@ -12,11 +12,21 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
 django.setup()
 
-from django.test import Client
+from django.test import RequestFactory
 from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+
+from core.views import register
 
 User = get_user_model()
 
+
+def _response_json(response):
+    """Décode le JSON d'une Response DRF (à rendre) ou d'une JsonResponse"""
+    if hasattr(response, 'render'):
+        response.render()
+    return json.loads(response.content)
+
 def test_register():
     """Test l'endpoint d'inscription"""
     print("=" * 70)
@@ -27,8 +37,8 @@ def test_register():
     # Supprimer l'utilisateur test s'il existe déjà
     User.objects.filter(username='testuser').delete()
 
-    # Créer un client de test
-    client = Client()
+    # Appel direct de la vue : pas de pile middleware ni de résolution d'URL
+    factory = RequestFactory()
 
     # Données de test
     data = {
@@ -47,11 +57,13 @@ def test_register():
     print()
 
     # Envoyer la requête
-    response = client.post(
+    request = factory.post(
         '/api/core/auth/register/',
         data=json.dumps(data),
         content_type='application/json'
     )
+    request.user = AnonymousUser()
+    response = register(request)
 
     print(f"📥 Réponse reçue:")
     print(f"   Status: {response.status_code}")
@@ -60,30 +72,37 @@ def test_register():
     if response.status_code == 201:
         print("✅ INSCRIPTION RÉUSSIE!")
         print()
-        response_data = response.json()
+        response_data = _response_json(response)
         print("Données de réponse:")
         print(json.dumps(response_data, indent=2, ensure_ascii=False))
         print()
 
-        # Vérifier dans FreeRADIUS
+        # Vérifier dans FreeRADIUS : un seul aller-retour pour les trois tables
+        from django.db import connection
         from radius.models import RadCheck, RadReply, RadUserGroup
 
         print("🔍 Vérification dans FreeRADIUS:")
 
-        radcheck = RadCheck.objects.filter(username='testuser')
-        print(f"   radcheck: {radcheck.count()} entrée(s)")
-        for entry in radcheck:
-            print(f"      - {entry.attribute} {entry.op} {entry.value}")
-
-        radreply = RadReply.objects.filter(username='testuser')
-        print(f"   radreply: {radreply.count()} entrée(s)")
-        for entry in radreply:
-            print(f"      - {entry.attribute} {entry.op} {entry.value}")
-
-        radusergroup = RadUserGroup.objects.filter(username='testuser')
-        print(f"   radusergroup: {radusergroup.count()} entrée(s)")
-        for entry in radusergroup:
-            print(f"      - {entry.username} -> {entry.groupname}")
+        username = data['username']
+        entries = {'radcheck': [], 'radreply': [], 'radusergroup': []}
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT 'radcheck', attribute, op, value FROM {RadCheck._meta.db_table} WHERE username = %s "
+                f"UNION ALL SELECT 'radreply', attribute, op, value FROM {RadReply._meta.db_table} WHERE username = %s "
+                f"UNION ALL SELECT 'radusergroup', groupname, '', '' FROM {RadUserGroup._meta.db_table} WHERE username = %s",
+                [username, username, username]
+            )
+            for src, attribute, op, value in cursor.fetchall():
+                entries[src].append((attribute, op, value))
+
+        for src in ('radcheck', 'radreply'):
+            print(f"   {src}: {len(entries[src])} entrée(s)")
+            for attribute, op, value in entries[src]:
+                print(f"      - {attribute} {op} {value}")
+
+        print(f"   radusergroup: {len(entries['radusergroup'])} entrée(s)")
+        for groupname, _, _ in entries['radusergroup']:
+            print(f"      - {username} -> {groupname}")
 
         print()
         print("✅ L'utilisateur peut maintenant se connecter au portail captif Mikrotik!")
@@ -94,7 +113,7 @@ def test_register():
         print("❌ ERREUR D'INSCRIPTION")
         print()
         try:
-            error_data = response.json()
+            error_data = _response_json(response)
             print("Détails de l'erreur:")
             print(json.dumps(error_data, indent=2, ensure_ascii=False))
         except:
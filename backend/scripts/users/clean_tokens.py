@@ -29,6 +29,23 @@ def print_warning(message):
 def print_info(message):
     print(f"{BLUE}ℹ️  {message}{RESET}")
 
+def delete_tokens(outstanding):
+    """
+    Supprime les OutstandingToken du queryset et leurs BlacklistedToken.
+
+    _raw_delete émet un DELETE SQL direct sans le collector Django, donc sans
+    la cascade on_delete : les BlacklistedToken (FK vers OutstandingToken)
+    sont supprimés explicitement d'abord. La contrainte FK de la base refuse
+    tout orphelin au commit de la transaction.
+    """
+    from django.db import transaction
+    from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+    with transaction.atomic(using=outstanding.db):
+        blacklisted = BlacklistedToken.objects.using(outstanding.db).filter(token__in=outstanding)
+        blacklisted._raw_delete(blacklisted.db)
+        return outstanding._raw_delete(outstanding.db)
+
 def main():
     # Configurer Django
     BASE_DIR = Path(__file__).resolve().parent
@@ -81,8 +98,7 @@ def main():
         outstanding_count = OutstandingToken.objects.count()
         blacklisted_count = BlacklistedToken.objects.count()
 
-        OutstandingToken.objects.all().delete()
-        BlacklistedToken.objects.all().delete()
+        delete_tokens(OutstandingToken.objects.all())
 
         print_success(f"{outstanding_count} OutstandingTokens supprimés")
         print_success(f"{blacklisted_count} BlacklistedTokens supprimés")
@@ -102,7 +118,7 @@ def main():
     print()
 
     # Compter les tokens
-    outstanding_tokens = OutstandingToken.objects.filter(user=user)
+    outstanding_tokens = OutstandingToken.objects.filter(user=user).select_related('blacklistedtoken')
     outstanding_count = outstanding_tokens.count()
 
     if outstanding_count == 0:
@@ -117,11 +133,10 @@ def main():
         print(f"    Créé le: {token.created_at.strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"    Expire le: {token.expires_at.strftime('%Y-%m-%d %H:%M:%S')}")
 
-        # Vérifier si blacklisté
-        try:
-            blacklisted = BlacklistedToken.objects.get(token=token)
+        # Vérifier si blacklisté (chargé via select_related)
+        if hasattr(token, 'blacklistedtoken'):
             print(f"    Status: {YELLOW}Blacklisté{RESET}")
-        except BlacklistedToken.DoesNotExist:
+        else:
             print(f"    Status: {GREEN}Actif{RESET}")
 
         print()
@@ -132,8 +147,8 @@ def main():
         print_info("Opération annulée")
         return 0
 
-    # Supprimer les tokens
-    deleted_count, _ = outstanding_tokens.delete()
+    # Supprimer les tokens (BlacklistedToken d'abord, sans passer par le collector)
+    deleted_count = delete_tokens(OutstandingToken.objects.filter(user=user))
 
     print()
     print_success(f"{deleted_count} token(s) supprimé(s)")
@@ -31,6 +31,7 @@ def main():
     BASE_DIR = Path(__file__).resolve().parent
     sys.path.insert(0, str(BASE_DIR))
     os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+    os.environ.setdefault('DJANGO_SCRIPT_MINIMAL', '1')
 
     try:
         django.setup()
@@ -42,16 +43,22 @@ def main():
 
     User = get_user_model()
 
-    print(f"\n{BOLD}{'='*70}{RESET}")
-    print(f"{BOLD}{'CORRECTION DES PERMISSIONS ADMIN'.center(70)}{RESET}")
-    print(f"{BOLD}{'='*70}{RESET}\n")
+    sys.stdout.write(
+        f"\n{BOLD}{'='*70}{RESET}\n"
+        f"{BOLD}{'CORRECTION DES PERMISSIONS ADMIN'.center(70)}{RESET}\n"
+        f"{BOLD}{'='*70}{RESET}\n\n"
+    )
 
     # Demander le nom d'utilisateur
     if len(sys.argv) > 1:
         username = sys.argv[1]
     else:
         print_info("Utilisateurs existants:")
-        for user in User.objects.all():
+        users = User.objects.only(
+            'username', 'is_superuser', 'is_staff', 'is_active'
+        ).order_by('username')
+        lines = []
+        for user in users.iterator(chunk_size=1000):
             status = []
             if user.is_superuser:
                 status.append("superuser")
@@ -61,9 +68,10 @@ def main():
                 status.append("inactif")
 
             status_str = f" ({', '.join(status)})" if status else ""
-            print(f"  • {user.username}{status_str}")
+            lines.append(f"  • {user.username}{status_str}")
 
-        print()
+        # Une seule écriture pour toute la liste
+        sys.stdout.write("\n".join(lines) + "\n\n")
         username = input("Entrez le nom d'utilisateur à corriger: ").strip()
 
     if not username:
@@ -126,14 +134,17 @@ def main():
     print(f"  is_staff:     {GREEN}{user.is_staff}{RESET}")
     print(f"  is_active:    {GREEN}{user.is_active}{RESET}")
 
-    print()
-    print(f"{BOLD}{'─'*70}{RESET}")
-    print(f"{BOLD}L'utilisateur '{username}' peut maintenant:{RESET}")
-    print(f"  {GREEN}✅{RESET} Accéder à l'admin Django: http://localhost:8000/admin")
-    print(f"  {GREEN}✅{RESET} Accéder au dashboard admin frontend: http://localhost:5173")
-    print(f"  {GREEN}✅{RESET} Gérer tous les utilisateurs")
-    print(f"  {GREEN}✅{RESET} Accéder à toutes les fonctionnalités admin")
-    print(f"{BOLD}{'─'*70}{RESET}\n")
+    sys.stdout.write("\n".join([
+        "",
+        f"{BOLD}{'─'*70}{RESET}",
+        f"{BOLD}L'utilisateur '{username}' peut maintenant:{RESET}",
+        f"  {GREEN}✅{RESET} Accéder à l'admin Django: http://localhost:8000/admin",
+        f"  {GREEN}✅{RESET} Accéder au dashboard admin frontend: http://localhost:5173",
+        f"  {GREEN}✅{RESET} Gérer tous les utilisateurs",
+        f"  {GREEN}✅{RESET} Accéder à toutes les fonctionnalités admin",
+        f"{BOLD}{'─'*70}{RESET}",
+        "",
+    ]) + "\n")
 
     return 0
 
@@ -9,6 +9,7 @@ import django
 # Configuration Django
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+os.environ.setdefault('DJANGO_SCRIPT_MINIMAL', '1')
 django.setup()
 
 from core.models import User
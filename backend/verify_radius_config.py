@@ -7,23 +7,27 @@ Usage:
 Ou dans le shell Django:
     exec(open('verify_radius_config.py').read())
 """
+import sys
+from collections import defaultdict
+from itertools import groupby
+from operator import attrgetter
+
 from django.db import connection
 from radius.models import RadGroupReply, RadGroupCheck, RadUserGroup, RadCheck
 from radius.services import RadiusProfileGroupService
 from core.models import Profile, User
 
 def print_section(title):
-    print("\n" + "=" * 70)
-    print(f" {title}")
-    print("=" * 70)
+    rule = "=" * 70
+    sys.stdout.write(f"\n{rule}\n {title}\n{rule}\n")
 
 def verify_radius_config():
     print_section("DIAGNOSTIC RADIUS - ARCHITECTURE GROUP-BASED")
 
     # 1. Vérifier les profils Django
     print_section("1. PROFILS DJANGO")
-    profiles = Profile.objects.filter(is_active=True)
-    print(f"Profils actifs: {profiles.count()}")
+    profiles = list(Profile.objects.filter(is_active=True))
+    print(f"Profils actifs: {len(profiles)}")
     for p in profiles:
         groupname = RadiusProfileGroupService.get_group_name(p)
         print(f"  - {p.name} (ID: {p.id}) → {groupname}")
@@ -33,34 +37,36 @@ def verify_radius_config():
 
     # 2. Vérifier radgroupreply
     print_section("2. RADGROUPREPLY (Attributs de groupe)")
-    groups = RadGroupReply.objects.filter(groupname__startswith='profile_').values('groupname').distinct()
-    print(f"Groupes configurés: {groups.count()}")
+    # Une seule requête pour tous les groupes, regroupés en Python
+    groups = defaultdict(list)
+    for attr in RadGroupReply.objects.filter(
+        groupname__startswith='profile_'
+    ).order_by('groupname', 'attribute'):
+        groups[attr.groupname].append(attr)
+    print(f"Groupes configurés: {len(groups)}")
 
-    for g in groups:
-        attrs = RadGroupReply.objects.filter(groupname=g['groupname']).order_by('attribute')
-        print(f"\n  {g['groupname']}:")
-        for attr in attrs:
-            print(f"    {attr.attribute} {attr.op} {attr.value}")
+    lines = []
+    for groupname, attrs in groups.items():
+        lines.append(f"\n  {groupname}:")
+        lines.extend(f"    {attr.attribute} {attr.op} {attr.value}" for attr in attrs)
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
     # 3. Vérifier radgroupcheck
     print_section("3. RADGROUPCHECK (Vérifications de groupe)")
     checks = RadGroupCheck.objects.filter(groupname__startswith='profile_')
     print(f"Entrées: {checks.count()}")
-    for c in checks:
-        print(f"  {c.groupname}: {c.attribute} {c.op} {c.value}")
+    sys.stdout.write("".join(f"  {c.groupname}: {c.attribute} {c.op} {c.value}\n" for c in checks))
 
     # 4. Vérifier radusergroup
     print_section("4. RADUSERGROUP (Assignations utilisateur → groupe)")
     usergroups = RadUserGroup.objects.filter(groupname__startswith='profile_').order_by('groupname', 'priority')
     print(f"Assignations: {usergroups.count()}")
 
-    by_group = {}
-    for ug in usergroups:
-        if ug.groupname not in by_group:
-            by_group[ug.groupname] = []
-        by_group[ug.groupname].append(f"{ug.username} (p:{ug.priority})")
-
-    for group, users in by_group.items():
+    # Les lignes arrivent triées par groupe : groupby suffit, sans dict intermédiaire
+    rows = usergroups.only('username', 'groupname', 'priority').iterator(chunk_size=2000)
+    for group, items in groupby(rows, key=attrgetter('groupname')):
+        users = [f"{ug.username} (p:{ug.priority})" for ug in items]
         print(f"\n  {group}:")
         print(f"    Utilisateurs: {', '.join(users[:5])}")
         if len(users) > 5:
@@ -68,23 +74,24 @@ def verify_radius_config():
 
     # 5. Utilisateurs sans groupe profil
     print_section("5. UTILISATEURS SANS GROUPE PROFIL")
-    activated_users = User.objects.filter(is_radius_activated=True, is_active=True)
-    users_with_groups = set(RadUserGroup.objects.filter(
-        groupname__startswith='profile_'
-    ).values_list('username', flat=True))
-
-    without_groups = []
-    for user in activated_users:
-        if user.username not in users_with_groups:
+    # Anti-jointure côté SQL plutôt qu'une différence d'ensembles en Python
+    missing_qs = User.objects.filter(
+        is_radius_activated=True, is_active=True
+    ).exclude(
+        username__in=RadUserGroup.objects.filter(
+            groupname__startswith='profile_'
+        ).values('username')
+    ).select_related('profile', 'promotion__profile')
+
+    # Seuls les 10 premiers sont affichés : LIMIT + COUNT plutôt que la liste complète
+    missing_total = missing_qs.count()
+    if missing_total:
+        print(f"Utilisateurs activés SANS groupe profil: {missing_total}")
+        for user in missing_qs.order_by('username')[:10]:
             profile = user.get_effective_profile()
-            without_groups.append(f"{user.username} (profile: {profile.name if profile else 'AUCUN'})")
-
-    if without_groups:
-        print(f"Utilisateurs activés SANS groupe profil: {len(without_groups)}")
-        for u in without_groups[:10]:
-            print(f"  ⚠️  {u}")
-        if len(without_groups) > 10:
-            print(f"  ... et {len(without_groups) - 10} autres")
+            print(f"  ⚠️  {user.username} (profile: {profile.name if profile else 'AUCUN'})")
+        if missing_total > 10:
+            print(f"  ... et {missing_total - 10} autres")
     else:
         print("✅ Tous les utilisateurs activés ont un groupe profil")
 
@@ -100,11 +107,11 @@ def verify_radius_config():
     print_section("RÉSUMÉ")
     issues = []
 
-    if groups.count() != profiles.count():
-        issues.append(f"Groupes RADIUS ({groups.count()}) != Profils Django ({profiles.count()})")
+    if len(groups) != len(profiles):
+        issues.append(f"Groupes RADIUS ({len(groups)}) != Profils Django ({len(profiles)})")
 
-    if without_groups:
-        issues.append(f"{len(without_groups)} utilisateurs activés sans groupe profil")
+    if missing_total:
+        issues.append(f"{missing_total} utilisateurs activés sans groupe profil")
 
     if not RadGroupReply.objects.filter(attribute='Mikrotik-Rate-Limit').exists():
         issues.append("Aucun attribut Mikrotik-Rate-Limit trouvé")
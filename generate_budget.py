@@ -1,48 +1,69 @@
 #!/usr/bin/env python3
-"""Generate a professional budget Excel file for the Captive Portal project."""
+"""Generate a professional budget Excel file for the Captive Portal project.
+
+A JSON file with the same figures is written next to the workbook for
+scripts and dashboards that only need the numbers.
+"""
+
+import datetime
+import json
+from zipfile import ZipFile, ZIP_DEFLATED
 
 from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, numbers
+from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle, numbers
 from openpyxl.utils import get_column_letter
+from openpyxl.workbook.defined_name import DefinedName
+from openpyxl.writer.excel import ExcelWriter
 
 wb = Workbook()
 
 # ═══════════════════════════════════════════════════════════════
-# Colors
+# Colors (ARGB: explicit FF alpha, some readers treat 00 as transparent)
 # ═══════════════════════════════════════════════════════════════
-DARK_BLUE = "1A365D"
-MEDIUM_BLUE = "1E40AF"
-LIGHT_BLUE = "DBEAFE"
-WHITE = "FFFFFF"
-LIGHT_GRAY = "F1F5F9"
-GREEN_BG = "D1FAE5"
-ORANGE_BG = "FEF3C7"
-RED_BG = "FEE2E2"
-PURPLE_BG = "EDE9FE"
+DARK_BLUE = "FF1A365D"
+MEDIUM_BLUE = "FF1E40AF"
+LIGHT_BLUE = "FFDBEAFE"
+WHITE = "FFFFFFFF"
+LIGHT_GRAY = "FFF1F5F9"
+GREEN_BG = "FFD1FAE5"
+ORANGE_BG = "FFFEF3C7"
+RED_BG = "FFFEE2E2"
+PURPLE_BG = "FFEDE9FE"
+GREEN = "FF10B981"
+MUTED_GRAY = "FF64748B"
+
+
+def solid_fill(color):
+    return PatternFill(start_color=color, end_color=color, fill_type="solid")
+
 
 header_font = Font(name="Calibri", bold=True, color=WHITE, size=12)
-header_fill = PatternFill(start_color=MEDIUM_BLUE, end_color=MEDIUM_BLUE, fill_type="solid")
+header_fill = solid_fill(MEDIUM_BLUE)
 title_font = Font(name="Calibri", bold=True, color=DARK_BLUE, size=14)
 subtitle_font = Font(name="Calibri", bold=True, color=DARK_BLUE, size=11)
 normal_font = Font(name="Calibri", size=11)
 bold_font = Font(name="Calibri", bold=True, size=11)
 total_font = Font(name="Calibri", bold=True, color=WHITE, size=12)
-total_fill = PatternFill(start_color=DARK_BLUE, end_color=DARK_BLUE, fill_type="solid")
+total_fill = solid_fill(DARK_BLUE)
+grand_total_fill = solid_fill(GREEN)
+free_font = Font(name="Calibri", color=GREEN, size=11, bold=True)
+sheet_title_font = Font(name="Calibri", bold=True, color=DARK_BLUE, size=16)
+note_font = Font(name="Calibri", color=MUTED_GRAY, size=11)
+note_italic_font = Font(name="Calibri", italic=True, color=MUTED_GRAY, size=11)
 
 cat_fills = {
-    "RH": PatternFill(start_color=LIGHT_BLUE, end_color=LIGHT_BLUE, fill_type="solid"),
-    "HW": PatternFill(start_color=ORANGE_BG, end_color=ORANGE_BG, fill_type="solid"),
-    "SW": PatternFill(start_color=GREEN_BG, end_color=GREEN_BG, fill_type="solid"),
-    "FONC": PatternFill(start_color=PURPLE_BG, end_color=PURPLE_BG, fill_type="solid"),
-    "gray": PatternFill(start_color=LIGHT_GRAY, end_color=LIGHT_GRAY, fill_type="solid"),
+    key: solid_fill(color)
+    for key, color in (
+        ("RH", LIGHT_BLUE),
+        ("HW", ORANGE_BG),
+        ("SW", GREEN_BG),
+        ("FONC", PURPLE_BG),
+        ("gray", LIGHT_GRAY),
+    )
 }
 
-thin_border = Border(
-    left=Side(style="thin", color="CBD5E1"),
-    right=Side(style="thin", color="CBD5E1"),
-    top=Side(style="thin", color="CBD5E1"),
-    bottom=Side(style="thin", color="CBD5E1"),
-)
+thin_side = Side(style="thin", color="FFCBD5E1")
+thin_border = Border(left=thin_side, right=thin_side, top=thin_side, bottom=thin_side)
 
 center = Alignment(horizontal="center", vertical="center", wrap_text=True)
 left_wrap = Alignment(horizontal="left", vertical="center", wrap_text=True)
@@ -54,8 +75,7 @@ EUR_RATE = 656  # 1 EUR = 656 XAF
 
 
 def style_range(ws, row, col_start, col_end, font=None, fill=None, alignment=None, border=None, number_format=None):
-    for c in range(col_start, col_end + 1):
-        cell = ws.cell(row=row, column=c)
+    for cell in next(ws.iter_rows(min_row=row, max_row=row, min_col=col_start, max_col=col_end)):
         if font:
             cell.font = font
         if fill:
@@ -68,6 +88,87 @@ def style_range(ws, row, col_start, col_end, font=None, fill=None, alignment=Non
             cell.number_format = number_format
 
 
+def register_body_style(name, alignment=None, number_format="General", fill=None):
+    """Register a named style bundling font, border, fill, alignment and number format."""
+    style = NamedStyle(name=name, font=normal_font, border=thin_border, number_format=number_format)
+    if alignment:
+        style.alignment = alignment
+    if fill:
+        style.fill = fill
+    wb.add_named_style(style)
+    return name
+
+
+def merge_styled(ws, cell_range, value, font=None, fill=None, alignment=None, border=None):
+    """Set value and style on the top-left cell of ``cell_range``, then merge it.
+
+    The other cells of a merge are MergedCells that Excel renders from the
+    top-left one; merging after styling lets openpyxl copy the border onto the
+    range outline instead of styling every covered cell.
+    """
+    cell = ws[cell_range.split(":")[0]]
+    cell.value = value
+    if font:
+        cell.font = font
+    if fill:
+        cell.fill = fill
+    if alignment:
+        cell.alignment = alignment
+    if border:
+        cell.border = border
+    ws.merge_cells(cell_range)
+    return cell
+
+
+# One named style per column kind and zebra parity: a single cell.style write per cell
+ITEM_STYLES = {}
+for parity, suffix, fill in ((1, "odd", None), (0, "even", cat_fills["gray"])):
+    centered = register_body_style(f"body_center_{suffix}", center, fill=fill)
+    text = register_body_style(f"body_text_{suffix}", left_wrap, fill=fill)
+    amount = register_body_style(f"body_amount_{suffix}", right_align, XAF_FORMAT, fill=fill)
+    ITEM_STYLES[parity] = (centered, text, centered, amount, amount)
+
+
+def append_item(ws, idx, name, qty, price):
+    """Append one line item with ws.append and style its cells in a single pass."""
+    # Columns F/G only hold subtotal-row values: leave them out of item rows
+    ws.append([idx, name, qty, price, qty * price])
+    cells = next(ws.iter_rows(min_row=ws.max_row, max_row=ws.max_row, max_col=5))
+    for cell, style in zip(cells, ITEM_STYLES[idx % 2]):
+        cell.style = style
+    return cells
+
+
+def write_section(ws, row, title, items, fill_key, subtotal_label):
+    """Write a category block (header, line items, subtotal) starting at ``row``.
+
+    Items are ``(name, qty, price, ...)`` tuples; free items (price 0) show
+    GRATUIT. Returns ``(subtotal, subtotal_row)``.
+    """
+    fill = cat_fills[fill_key]
+    merge_styled(ws, f"A{row}:G{row}", title, font=subtitle_font, fill=fill, alignment=left_wrap, border=thin_border)
+
+    subtotal = 0
+    for idx, (name, qty, price, *_) in enumerate(items, 1):
+        cells = append_item(ws, idx, name, qty, price)
+        subtotal += qty * price
+        if price == 0:
+            for cell in cells[3:5]:
+                cell.value = "GRATUIT"
+                cell.number_format = "@"
+                cell.font = free_font
+                cell.alignment = center
+
+    row = ws.max_row + 1
+    ws.cell(row=row, column=2, value=subtotal_label).font = bold_font
+    cell = ws.cell(row=row, column=6, value=f"=SUM(E{row - len(items)}:E{row - 1})")
+    cell.number_format = XAF_FORMAT
+    cell.font = bold_font
+    cell.alignment = right_align
+    style_range(ws, row, 1, 7, fill=fill, border=thin_border)
+    return subtotal, row
+
+
 # ═══════════════════════════════════════════════════════════════
 # SHEET 1 — Budget Détaillé
 # ═══════════════════════════════════════════════════════════════
@@ -75,23 +176,18 @@ ws = wb.active
 ws.title = "Budget Détaillé"
 
 # Column widths
-ws.column_dimensions["A"].width = 5
-ws.column_dimensions["B"].width = 40
-ws.column_dimensions["C"].width = 12
-ws.column_dimensions["D"].width = 18
-ws.column_dimensions["E"].width = 18
-ws.column_dimensions["F"].width = 22
-ws.column_dimensions["G"].width = 15
+for letter, width in zip("ABCDEFG", (5, 40, 12, 18, 18, 22, 15)):
+    ws.column_dimensions[letter].width = width
 
 # Title
 ws.merge_cells("A1:G1")
 ws["A1"] = "BUDGET PRÉVISIONNEL — PORTAIL CAPTIF WIFI UCAC-ICAM"
-ws["A1"].font = Font(name="Calibri", bold=True, color=DARK_BLUE, size=16)
+ws["A1"].font = sheet_title_font
 ws["A1"].alignment = Alignment(horizontal="center", vertical="center")
 
 ws.merge_cells("A2:G2")
 ws["A2"] = "Projet de fin d'études — Janvier 2026  |  Devise : FCFA (1 EUR = 656 FCFA)"
-ws["A2"].font = Font(name="Calibri", color="64748B", size=11)
+ws["A2"].font = note_font
 ws["A2"].alignment = Alignment(horizontal="center")
 
 # Headers row 4
@@ -104,12 +200,7 @@ for i, h in enumerate(headers, 1):
     cell.alignment = center
     cell.border = thin_border
 
-# ─── RESSOURCES HUMAINES ───
-row = 5
-ws.merge_cells(f"A{row}:G{row}")
-ws.cell(row=row, column=1, value="1. RESSOURCES HUMAINES")
-style_range(ws, row, 1, 7, font=subtitle_font, fill=cat_fills["RH"], alignment=left_wrap, border=thin_border)
-
+# ─── Sections ───
 rh_items = [
     ("Chef de projet / Développeur principal", 5, 250000),
     ("Ingénieur réseau (consultant MikroTik)", 2, 200000),
@@ -118,39 +209,6 @@ rh_items = [
     ("Rédacteur technique (documentation)", 1, 50000),
 ]
 
-rh_start = row + 1
-for idx, (name, qty, price) in enumerate(rh_items, 1):
-    row += 1
-    ws.cell(row=row, column=1, value=idx).alignment = center
-    ws.cell(row=row, column=2, value=name).alignment = left_wrap
-    ws.cell(row=row, column=3, value=qty).alignment = center
-    ws.cell(row=row, column=4, value=price).number_format = XAF_FORMAT
-    ws.cell(row=row, column=4).alignment = right_align
-    ws.cell(row=row, column=5, value=qty * price).number_format = XAF_FORMAT
-    ws.cell(row=row, column=5).alignment = right_align
-    for c in range(1, 8):
-        ws.cell(row=row, column=c).font = normal_font
-        ws.cell(row=row, column=c).border = thin_border
-        if idx % 2 == 0:
-            ws.cell(row=row, column=c).fill = cat_fills["gray"]
-rh_end = row
-
-# Sous-total RH
-row += 1
-ws.cell(row=row, column=2, value="Sous-total Ressources Humaines").font = bold_font
-ws.cell(row=row, column=5).alignment = right_align
-rh_total = sum(q * p for _, q, p in rh_items)
-ws.cell(row=row, column=6, value=rh_total).number_format = XAF_FORMAT
-ws.cell(row=row, column=6).font = bold_font
-ws.cell(row=row, column=6).alignment = right_align
-style_range(ws, row, 1, 7, fill=cat_fills["RH"], border=thin_border)
-
-# ─── MATÉRIEL / HARDWARE ───
-row += 1
-ws.merge_cells(f"A{row}:G{row}")
-ws.cell(row=row, column=1, value="2. MATÉRIEL (HARDWARE)")
-style_range(ws, row, 1, 7, font=subtitle_font, fill=cat_fills["HW"], alignment=left_wrap, border=thin_border)
-
 hw_items = [
     ("Routeur MikroTik RB951Ui-2HnD", 1, 75000),
     ("Ordinateur portable (développement)", 1, 400000),
@@ -161,35 +219,6 @@ hw_items = [
     ("Switch réseau 8 ports", 1, 25000),
 ]
 
-for idx, (name, qty, price) in enumerate(hw_items, 1):
-    row += 1
-    ws.cell(row=row, column=1, value=idx).alignment = center
-    ws.cell(row=row, column=2, value=name).alignment = left_wrap
-    ws.cell(row=row, column=3, value=qty).alignment = center
-    ws.cell(row=row, column=4, value=price).number_format = XAF_FORMAT
-    ws.cell(row=row, column=4).alignment = right_align
-    ws.cell(row=row, column=5, value=qty * price).number_format = XAF_FORMAT
-    ws.cell(row=row, column=5).alignment = right_align
-    for c in range(1, 8):
-        ws.cell(row=row, column=c).font = normal_font
-        ws.cell(row=row, column=c).border = thin_border
-        if idx % 2 == 0:
-            ws.cell(row=row, column=c).fill = cat_fills["gray"]
-
-row += 1
-ws.cell(row=row, column=2, value="Sous-total Matériel").font = bold_font
-hw_total = sum(q * p for _, q, p in hw_items)
-ws.cell(row=row, column=6, value=hw_total).number_format = XAF_FORMAT
-ws.cell(row=row, column=6).font = bold_font
-ws.cell(row=row, column=6).alignment = right_align
-style_range(ws, row, 1, 7, fill=cat_fills["HW"], border=thin_border)
-
-# ─── LOGICIELS ───
-row += 1
-ws.merge_cells(f"A{row}:G{row}")
-ws.cell(row=row, column=1, value="3. LOGICIELS")
-style_range(ws, row, 1, 7, font=subtitle_font, fill=cat_fills["SW"], alignment=left_wrap, border=thin_border)
-
 sw_items = [
     ("Ubuntu Server 22.04 LTS", 1, 0, "Open Source"),
     ("PostgreSQL 15", 1, 0, "Open Source"),
@@ -203,44 +232,6 @@ sw_items = [
     ("Certificat SSL (Let's Encrypt)", 1, 0, "Gratuit"),
 ]
 
-for idx, (name, qty, price, note) in enumerate(sw_items, 1):
-    row += 1
-    ws.cell(row=row, column=1, value=idx).alignment = center
-    ws.cell(row=row, column=2, value=name).alignment = left_wrap
-    ws.cell(row=row, column=3, value=qty).alignment = center
-    ws.cell(row=row, column=4, value=price).number_format = XAF_FORMAT
-    ws.cell(row=row, column=4).alignment = right_align
-    ws.cell(row=row, column=5, value=qty * price).number_format = XAF_FORMAT
-    ws.cell(row=row, column=5).alignment = right_align
-    for c in range(1, 8):
-        ws.cell(row=row, column=c).font = normal_font
-        ws.cell(row=row, column=c).border = thin_border
-        if price == 0:
-            ws.cell(row=row, column=5).value = "GRATUIT"
-            ws.cell(row=row, column=5).number_format = "@"
-            ws.cell(row=row, column=5).font = Font(name="Calibri", color="10B981", size=11, bold=True)
-            ws.cell(row=row, column=5).alignment = center
-            ws.cell(row=row, column=4).value = "GRATUIT"
-            ws.cell(row=row, column=4).number_format = "@"
-            ws.cell(row=row, column=4).font = Font(name="Calibri", color="10B981", size=11, bold=True)
-            ws.cell(row=row, column=4).alignment = center
-        if idx % 2 == 0:
-            ws.cell(row=row, column=c).fill = cat_fills["gray"]
-
-row += 1
-ws.cell(row=row, column=2, value="Sous-total Logiciels").font = bold_font
-sw_total = sum(q * p for _, q, p, _ in sw_items)
-ws.cell(row=row, column=6, value=sw_total).number_format = XAF_FORMAT
-ws.cell(row=row, column=6).font = bold_font
-ws.cell(row=row, column=6).alignment = right_align
-style_range(ws, row, 1, 7, fill=cat_fills["SW"], border=thin_border)
-
-# ─── FONCTIONNEMENT ───
-row += 1
-ws.merge_cells(f"A{row}:G{row}")
-ws.cell(row=row, column=1, value="4. FRAIS DE FONCTIONNEMENT")
-style_range(ws, row, 1, 7, font=subtitle_font, fill=cat_fills["FONC"], alignment=left_wrap, border=thin_border)
-
 fonc_items = [
     ("Connexion Internet (test)", 3, 15000),
     ("Électricité (serveur)", 6, 10000),
@@ -249,93 +240,79 @@ fonc_items = [
     ("Déplacements / Transport", 5, 10000),
 ]
 
-for idx, (name, qty, price) in enumerate(fonc_items, 1):
-    row += 1
-    ws.cell(row=row, column=1, value=idx).alignment = center
-    ws.cell(row=row, column=2, value=name).alignment = left_wrap
-    ws.cell(row=row, column=3, value=qty).alignment = center
-    ws.cell(row=row, column=4, value=price).number_format = XAF_FORMAT
-    ws.cell(row=row, column=4).alignment = right_align
-    ws.cell(row=row, column=5, value=qty * price).number_format = XAF_FORMAT
-    ws.cell(row=row, column=5).alignment = right_align
-    for c in range(1, 8):
-        ws.cell(row=row, column=c).font = normal_font
-        ws.cell(row=row, column=c).border = thin_border
-        if idx % 2 == 0:
-            ws.cell(row=row, column=c).fill = cat_fills["gray"]
-
-row += 1
-ws.cell(row=row, column=2, value="Sous-total Fonctionnement").font = bold_font
-fonc_total = sum(q * p for _, q, p in fonc_items)
-ws.cell(row=row, column=6, value=fonc_total).number_format = XAF_FORMAT
-ws.cell(row=row, column=6).font = bold_font
-ws.cell(row=row, column=6).alignment = right_align
-style_range(ws, row, 1, 7, fill=cat_fills["FONC"], border=thin_border)
+rh_total, rh_row = write_section(ws, 5, "1. RESSOURCES HUMAINES", rh_items, "RH", "Sous-total Ressources Humaines")
+hw_total, hw_row = write_section(ws, rh_row + 1, "2. MATÉRIEL (HARDWARE)", hw_items, "HW", "Sous-total Matériel")
+sw_total, sw_row = write_section(ws, hw_row + 1, "3. LOGICIELS", sw_items, "SW", "Sous-total Logiciels")
+fonc_total, fonc_row = write_section(ws, sw_row + 1, "4. FRAIS DE FONCTIONNEMENT", fonc_items, "FONC", "Sous-total Fonctionnement")
+row = fonc_row
 
 # ─── TOTAL GÉNÉRAL ───
 row += 2
 total = rh_total + hw_total + sw_total + fonc_total
 
-ws.merge_cells(f"A{row}:E{row}")
-ws.cell(row=row, column=1, value="TOTAL GÉNÉRAL")
-ws.cell(row=row, column=6, value=total).number_format = XAF_FORMAT
-style_range(ws, row, 1, 7, font=total_font, fill=total_fill, alignment=center, border=thin_border)
-ws.cell(row=row, column=6).alignment = right_align
+total_row = row
+merge_styled(ws, f"A{row}:E{row}", "TOTAL GÉNÉRAL", font=total_font, fill=total_fill, alignment=center, border=thin_border)
+total_cell = ws.cell(row=row, column=6, value=f"=F{rh_row}+F{hw_row}+F{sw_row}+F{fonc_row}")
+total_cell.number_format = XAF_FORMAT
+style_range(ws, row, 6, 7, font=total_font, fill=total_fill, alignment=center, border=thin_border)
+total_cell.alignment = right_align
 
 # Contingency
 row += 1
 contingency = int(total * 0.1)
-ws.merge_cells(f"A{row}:E{row}")
-ws.cell(row=row, column=1, value="Provision pour imprévus (10%)")
-ws.cell(row=row, column=1).font = bold_font
-ws.cell(row=row, column=6, value=contingency).number_format = XAF_FORMAT
-ws.cell(row=row, column=6).font = bold_font
-ws.cell(row=row, column=6).alignment = right_align
-style_range(ws, row, 1, 7, fill=cat_fills["gray"], border=thin_border)
+contingency_row = row
+merge_styled(ws, f"A{row}:E{row}", "Provision pour imprévus (10%)", font=bold_font, fill=cat_fills["gray"], border=thin_border)
+cell = ws.cell(row=row, column=6, value=f"=INT(F{total_row}*0.1)")
+cell.number_format = XAF_FORMAT
+cell.font = bold_font
+cell.alignment = right_align
+style_range(ws, row, 6, 7, fill=cat_fills["gray"], border=thin_border)
 
 # Grand total
 row += 1
 grand_total = total + contingency
-ws.merge_cells(f"A{row}:E{row}")
-ws.cell(row=row, column=1, value="BUDGET TOTAL (avec imprévus)")
-ws.cell(row=row, column=6, value=grand_total).number_format = XAF_FORMAT
-style_range(ws, row, 1, 7, font=total_font, fill=PatternFill(start_color="10B981", end_color="10B981", fill_type="solid"), alignment=center, border=thin_border)
-ws.cell(row=row, column=6).alignment = right_align
+grand_total_row = row
+merge_styled(ws, f"A{row}:E{row}", "BUDGET TOTAL (avec imprévus)", font=total_font, fill=grand_total_fill, alignment=center, border=thin_border)
+cell = ws.cell(row=row, column=6, value=f"=F{total_row}+F{contingency_row}")
+cell.number_format = XAF_FORMAT
+style_range(ws, row, 6, 7, font=total_font, fill=grand_total_fill, alignment=center, border=thin_border)
+cell.alignment = right_align
 
 # EUR equivalent
 row += 1
 ws.merge_cells(f"A{row}:E{row}")
-ws.cell(row=row, column=1, value=f"Équivalent en EUR (1 EUR = {EUR_RATE} FCFA)")
-ws.cell(row=row, column=1).font = Font(name="Calibri", italic=True, color="64748B", size=11)
-ws.cell(row=row, column=6, value=round(grand_total / EUR_RATE, 2))
-ws.cell(row=row, column=6).number_format = '#,##0.00" EUR"'
-ws.cell(row=row, column=6).font = Font(name="Calibri", italic=True, color="64748B", size=11)
-ws.cell(row=row, column=6).alignment = right_align
+ws.cell(row=row, column=1, value=f"Équivalent en EUR (1 EUR = {EUR_RATE} FCFA)").font = note_italic_font
+cell = ws.cell(row=row, column=6, value=f"=ROUND(F{grand_total_row}/EUR_RATE,2)")
+cell.number_format = '#,##0.00" EUR"'
+cell.font = note_italic_font
+cell.alignment = right_align
 
 # ─── Percentages in column G ───
 # Go back and fill percentages for subtotals
-for r in range(5, row + 1):
-    val = ws.cell(row=r, column=6).value
-    if isinstance(val, (int, float)) and val > 0 and val != grand_total and val != contingency and val != round(grand_total / EUR_RATE, 2):
-        ws.cell(row=r, column=7, value=val / total)
-        ws.cell(row=r, column=7).number_format = PERCENT_FORMAT
-        ws.cell(row=r, column=7).alignment = center
-        ws.cell(row=r, column=7).font = bold_font
+for r in (rh_row, hw_row, sw_row, fonc_row, total_row):
+    cell = ws.cell(row=r, column=7, value=f"=F{r}/$F${total_row}")
+    cell.number_format = PERCENT_FORMAT
+    cell.alignment = center
+    cell.font = bold_font
 
 # ═══════════════════════════════════════════════════════════════
 # SHEET 2 — Résumé
 # ═══════════════════════════════════════════════════════════════
 ws2 = wb.create_sheet("Résumé")
 
-ws2.column_dimensions["A"].width = 5
-ws2.column_dimensions["B"].width = 35
-ws2.column_dimensions["C"].width = 22
-ws2.column_dimensions["D"].width = 15
-ws2.column_dimensions["E"].width = 18
+# Exchange rate lives in a named cell: every EUR formula reads EUR_RATE
+ws2["F1"] = EUR_RATE
+ws2["F1"].number_format = '"1 EUR = "0" FCFA"'
+ws2["F1"].font = note_italic_font
+ws2["F1"].alignment = right_align
+wb.defined_names["EUR_RATE"] = DefinedName("EUR_RATE", attr_text=f"'{ws2.title}'!$F$1")
+
+for letter, width in zip("ABCDEF", (5, 35, 22, 15, 18, 18)):
+    ws2.column_dimensions[letter].width = width
 
 ws2.merge_cells("A1:E1")
 ws2["A1"] = "RÉSUMÉ BUDGÉTAIRE"
-ws2["A1"].font = Font(name="Calibri", bold=True, color=DARK_BLUE, size=16)
+ws2["A1"].font = sheet_title_font
 ws2["A1"].alignment = Alignment(horizontal="center")
 
 row2 = 3
@@ -348,53 +325,63 @@ for i, h in enumerate(headers2, 1):
     cell.border = thin_border
 
 categories = [
-    ("1", "Ressources Humaines", rh_total, cat_fills["RH"]),
-    ("2", "Matériel (Hardware)", hw_total, cat_fills["HW"]),
-    ("3", "Logiciels", sw_total, cat_fills["SW"]),
-    ("4", "Frais de Fonctionnement", fonc_total, cat_fills["FONC"]),
+    ("1", "Ressources Humaines", rh_row, cat_fills["RH"]),
+    ("2", "Matériel (Hardware)", hw_row, cat_fills["HW"]),
+    ("3", "Logiciels", sw_row, cat_fills["SW"]),
+    ("4", "Frais de Fonctionnement", fonc_row, cat_fills["FONC"]),
 ]
 
-for num, name, amount, fill in categories:
+# Amounts reference the detail sheet so both sheets stay in sync when edited
+detail = f"'{ws.title}'!"
+summary_total_row = row2 + len(categories) + 1
+
+summary_alignments = (center, left_wrap, right_align, center, right_align)
+summary_formats = ("General", "General", XAF_FORMAT, PERCENT_FORMAT, '#,##0" EUR"')
+
+for num, name, detail_row, fill in categories:
     row2 += 1
-    ws2.cell(row=row2, column=1, value=num).alignment = center
-    ws2.cell(row=row2, column=2, value=name).alignment = left_wrap
-    ws2.cell(row=row2, column=3, value=amount).number_format = XAF_FORMAT
-    ws2.cell(row=row2, column=3).alignment = right_align
-    ws2.cell(row=row2, column=4, value=amount / total).number_format = PERCENT_FORMAT
-    ws2.cell(row=row2, column=4).alignment = center
-    ws2.cell(row=row2, column=5, value=round(amount / EUR_RATE)).number_format = '#,##0" EUR"'
-    ws2.cell(row=row2, column=5).alignment = right_align
-    for c in range(1, 6):
-        ws2.cell(row=row2, column=c).font = normal_font
-        ws2.cell(row=row2, column=c).border = thin_border
-        ws2.cell(row=row2, column=c).fill = fill
+    values = (num, name, f"={detail}F{detail_row}", f"=C{row2}/$C${summary_total_row}", f"=ROUND(C{row2}/EUR_RATE,0)")
+    for c, (value, alignment, number_format) in enumerate(zip(values, summary_alignments, summary_formats), 1):
+        cell = ws2.cell(row=row2, column=c, value=value)
+        cell.alignment = alignment
+        cell.number_format = number_format
+        cell.font = normal_font
+        cell.border = thin_border
+        cell.fill = fill
 
 # Total
 row2 += 1
 ws2.cell(row=row2, column=2, value="TOTAL").font = total_font
-ws2.cell(row=row2, column=3, value=total).number_format = XAF_FORMAT
-ws2.cell(row=row2, column=3).alignment = right_align
-ws2.cell(row=row2, column=4, value=1).number_format = PERCENT_FORMAT
-ws2.cell(row=row2, column=4).alignment = center
-ws2.cell(row=row2, column=5, value=round(total / EUR_RATE)).number_format = '#,##0" EUR"'
-ws2.cell(row=row2, column=5).alignment = right_align
+cell = ws2.cell(row=row2, column=3, value=f"={detail}F{total_row}")
+cell.number_format = XAF_FORMAT
+cell.alignment = right_align
+cell = ws2.cell(row=row2, column=4, value=1)
+cell.number_format = PERCENT_FORMAT
+cell.alignment = center
+cell = ws2.cell(row=row2, column=5, value=f"=ROUND(C{row2}/EUR_RATE,0)")
+cell.number_format = '#,##0" EUR"'
+cell.alignment = right_align
 style_range(ws2, row2, 1, 5, font=total_font, fill=total_fill, border=thin_border)
 
 row2 += 1
 ws2.cell(row=row2, column=2, value="Imprévus (10%)").font = bold_font
-ws2.cell(row=row2, column=3, value=contingency).number_format = XAF_FORMAT
-ws2.cell(row=row2, column=3).alignment = right_align
-ws2.cell(row=row2, column=5, value=round(contingency / EUR_RATE)).number_format = '#,##0" EUR"'
-ws2.cell(row=row2, column=5).alignment = right_align
+cell = ws2.cell(row=row2, column=3, value=f"={detail}F{contingency_row}")
+cell.number_format = XAF_FORMAT
+cell.alignment = right_align
+cell = ws2.cell(row=row2, column=5, value=f"=ROUND(C{row2}/EUR_RATE,0)")
+cell.number_format = '#,##0" EUR"'
+cell.alignment = right_align
 style_range(ws2, row2, 1, 5, fill=cat_fills["gray"], border=thin_border)
 
 row2 += 1
 ws2.cell(row=row2, column=2, value="BUDGET TOTAL").font = total_font
-ws2.cell(row=row2, column=3, value=grand_total).number_format = XAF_FORMAT
-ws2.cell(row=row2, column=3).alignment = right_align
-ws2.cell(row=row2, column=5, value=round(grand_total / EUR_RATE)).number_format = '#,##0" EUR"'
-ws2.cell(row=row2, column=5).alignment = right_align
-style_range(ws2, row2, 1, 5, font=total_font, fill=PatternFill(start_color="10B981", end_color="10B981", fill_type="solid"), border=thin_border)
+cell = ws2.cell(row=row2, column=3, value=f"={detail}F{grand_total_row}")
+cell.number_format = XAF_FORMAT
+cell.alignment = right_align
+cell = ws2.cell(row=row2, column=5, value=f"=ROUND(C{row2}/EUR_RATE,0)")
+cell.number_format = '#,##0" EUR"'
+cell.alignment = right_align
+style_range(ws2, row2, 1, 5, font=total_font, fill=grand_total_fill, border=thin_border)
 
 # ─── Notes ───
 row2 += 2
@@ -414,7 +401,7 @@ for note in notes:
     row2 += 1
     ws2.merge_cells(f"A{row2}:E{row2}")
     ws2.cell(row=row2, column=1, value=note)
-    ws2.cell(row=row2, column=1).font = Font(name="Calibri", size=11, color="64748B")
+    ws2.cell(row=row2, column=1).font = note_font
 
 # Print settings
 for sheet in [ws, ws2]:
@@ -426,6 +413,37 @@ for sheet in [ws, ws2]:
 
 # Save
 output = "/home/user/captive-portal/Budget_Portail_Captif_UCAC_ICAM.xlsx"
-wb.save(output)
+# Same as wb.save(), but with the fastest deflate level: save time is mostly
+# zlib CPU and the file is tiny either way
+wb.properties.modified = datetime.datetime.now(tz=datetime.timezone.utc).replace(tzinfo=None)
+ExcelWriter(wb, ZipFile(output, "w", ZIP_DEFLATED, allowZip64=True, compresslevel=1)).save()
 print(f"Budget saved to: {output}")
+
+# Machine-readable figures: cheaper to consume than re-opening the xlsx
+budget_data = {
+    "currency": "XAF",
+    "eur_rate": EUR_RATE,
+    "categories": {
+        key: {
+            "items": [
+                {"name": name, "qty": qty, "unit_price": price, "amount": qty * price}
+                for name, qty, price, *_ in items
+            ],
+            "subtotal": subtotal,
+        }
+        for key, items, subtotal in (
+            ("rh", rh_items, rh_total),
+            ("hw", hw_items, hw_total),
+            ("sw", sw_items, sw_total),
+            ("fonc", fonc_items, fonc_total),
+        )
+    },
+    "total": total,
+    "contingency": contingency,
+    "grand_total": grand_total,
+}
+json_output = output.rsplit(".", 1)[0] + ".json"
+with open(json_output, "w", encoding="utf-8") as f:
+    json.dump(budget_data, f, ensure_ascii=False, indent=2)
+print(f"Budget figures saved to: {json_output}")
 print(f"Total budget: {grand_total:,} FCFA ({round(grand_total / EUR_RATE):,} EUR)")
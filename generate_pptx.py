@@ -2,6 +2,8 @@
 """Generate a visual PowerPoint presentation for the Captive Portal project.
 Focus on diagrams, schemas and illustrations with minimal text."""
 
+from io import BytesIO
+
 from pptx import Presentation
 from pptx.util import Inches, Pt, Emu
 from pptx.dml.color import RGBColor
@@ -14,6 +16,7 @@ DARK_BLUE = RGBColor(0x1A, 0x36, 0x5D)
 MEDIUM_BLUE = RGBColor(0x1E, 0x40, 0xAF)
 LIGHT_BLUE = RGBColor(0x25, 0x63, 0xEB)
 ACCENT_BLUE = RGBColor(0xDB, 0xEA, 0xFE)
+SUBTITLE_BLUE = RGBColor(0xBF, 0xDB, 0xFE)
 WHITE = RGBColor(0xFF, 0xFF, 0xFF)
 BLACK = RGBColor(0x33, 0x33, 0x33)
 GRAY = RGBColor(0x64, 0x74, 0x8B)
@@ -36,139 +39,207 @@ prs.slide_height = Inches(7.5)
 W = prs.slide_width
 H = prs.slide_height
 
+# Shape types resolved once rather than through an MSO_SHAPE lookup per shape
+RECTANGLE = MSO_SHAPE.RECTANGLE
+ROUNDED_RECTANGLE = MSO_SHAPE.ROUNDED_RECTANGLE
+OVAL = MSO_SHAPE.OVAL
+RIGHT_ARROW = MSO_SHAPE.RIGHT_ARROW
+DOWN_ARROW = MSO_SHAPE.DOWN_ARROW
+
+# Geometry shared by the helpers, converted to EMU once
+HEADER_HEIGHT = Inches(1.1)
+FOOTER_TOP = Inches(7.44)
+FOOTER_HEIGHT = Inches(0.06)
+BORDER_WIDTH = Pt(2)
+ARROW_THICKNESS = Inches(0.4)
+CARD_PAD = Inches(0.15)
+PARA_SPACING = Pt(4)
+BADGE_SIZE = Inches(1.2)
+
 
 def add_bg(slide, color=WHITE):
+    if color == WHITE:
+        return  # inherited from BLANK_LAYOUT
     bg = slide.background
     fill = bg.fill
     fill.solid()
     fill.fore_color.rgb = color
 
 
-def add_shape(slide, left, top, width, height, color, border_color=None, shape_type=MSO_SHAPE.ROUNDED_RECTANGLE):
-    shape = slide.shapes.add_shape(shape_type, left, top, width, height)
-    shape.fill.solid()
-    shape.fill.fore_color.rgb = color
+def paint(sp, color, border_color=None):
+    """Give an autoshape a solid fill and either a 2pt border or no outline.
+
+    Writes the same <p:spPr> children as shape.fill / shape.line would, straight
+    onto the element, so no FillFormat/LineFormat proxies are built per shape.
+    """
+    spPr = sp.spPr
+    spPr.get_or_change_to_solidFill().get_or_change_to_srgbClr().val = str(color)
+    ln = spPr.get_or_add_ln()
     if border_color:
-        shape.line.color.rgb = border_color
-        shape.line.width = Pt(2)
+        ln.get_or_change_to_solidFill().get_or_change_to_srgbClr().val = str(border_color)
+        ln.w = BORDER_WIDTH
     else:
-        shape.line.fill.background()
+        ln.get_or_change_to_noFill()
+
+
+def add_shape(slide, left, top, width, height, color, border_color=None, shape_type=ROUNDED_RECTANGLE):
+    shape = slide.shapes.add_shape(shape_type, left, top, width, height)
+    paint(shape._element, color, border_color)
     return shape
 
 
 def add_rect(slide, left, top, width, height, color):
-    shape = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, left, top, width, height)
-    shape.fill.solid()
-    shape.fill.fore_color.rgb = color
-    shape.line.fill.background()
+    shape = slide.shapes.add_shape(RECTANGLE, left, top, width, height)
+    paint(shape._element, color)
     return shape
 
 
-def set_text(shape, text, size=14, bold=False, color=BLACK, align=PP_ALIGN.LEFT):
-    tf = shape.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
+def write_para(p, text, size, bold, color, align):
+    """Fill a paragraph and style its font in one pass."""
     p.text = text
-    p.font.size = Pt(size)
-    p.font.bold = bold
-    p.font.color.rgb = color
+    font = p.font
+    font.size = Pt(size)
+    font.bold = bold
+    # Same <a:solidFill><a:srgbClr/> the font.color proxy writes, without building it
+    font._rPr.get_or_change_to_solidFill().get_or_change_to_srgbClr().val = str(color)
     p.alignment = align
+    return p
+
+
+def set_text(shape, text, size=14, bold=False, color=BLACK, align=PP_ALIGN.LEFT):
+    tf = shape.text_frame
+    tf._bodyPr.set("wrap", "square")  # what tf.word_wrap = True writes
+    write_para(tf.paragraphs[0], text, size, bold, color, align)
     return tf
 
 
-def add_para(tf, text, size=14, bold=False, color=BLACK, align=PP_ALIGN.LEFT, space_before=Pt(4)):
-    p = tf.add_paragraph()
-    p.text = text
-    p.font.size = Pt(size)
-    p.font.bold = bold
-    p.font.color.rgb = color
-    p.alignment = align
-    if space_before:
-        p.space_before = space_before
+def add_para(tf, text, size=14, bold=False, color=BLACK, align=PP_ALIGN.LEFT, space_before=PARA_SPACING):
+    p = write_para(tf.add_paragraph(), text, size, bold, color, align)
+    p.space_before = space_before  # None leaves the paragraph without spacing
     return p
 
 
 def add_text(slide, left, top, width, height, text, size=14, bold=False, color=BLACK, align=PP_ALIGN.LEFT):
     txBox = slide.shapes.add_textbox(left, top, width, height)
     tf = txBox.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    p.text = text
-    p.font.size = Pt(size)
-    p.font.bold = bold
-    p.font.color.rgb = color
-    p.alignment = align
+    tf._bodyPr.set("wrap", "square")  # what tf.word_wrap = True writes
+    write_para(tf.paragraphs[0], text, size, bold, color, align)
     return tf
 
 
 def header_bar(slide, title):
-    add_rect(slide, 0, 0, W, Inches(1.1), MEDIUM_BLUE)
+    add_rect(slide, 0, 0, W, HEADER_HEIGHT, MEDIUM_BLUE)
     txBox = slide.shapes.add_textbox(Inches(0.5), Inches(0.15), Inches(12), Inches(0.8))
     set_text(txBox, title, size=28, bold=True, color=WHITE)
 
 
-def footer_bar(slide):
-    add_rect(slide, 0, Inches(7.44), W, Inches(0.06), LIGHT_BLUE)
+def footer_bar(layout):
+    """Bake the footer bar into a slide layout so every slide built on it inherits it.
+
+    python-pptx has no public API to draw on a layout, so the rectangle is
+    appended straight to the layout's shape tree.
+    """
+    sp_tree = layout.shapes._spTree
+    sp = sp_tree.add_autoshape(sp_tree.max_shape_id + 1, "Footer Bar", "rect",
+                               0, FOOTER_TOP, W, FOOTER_HEIGHT)
+    paint(sp, LIGHT_BLUE)
 
 
 def icon_box(slide, left, top, size, icon_text, bg_color, text_color=WHITE):
     """Draw a rounded square icon with an emoji/symbol."""
     shape = add_shape(slide, left, top, Inches(size), Inches(size), bg_color)
     set_text(shape, icon_text, size=int(size * 28), bold=True, color=text_color, align=PP_ALIGN.CENTER)
-    shape.text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
     return shape
 
 
 def arrow_right(slide, left, top, width=Inches(1), color=MEDIUM_BLUE):
     """Draw a right arrow."""
-    arr = slide.shapes.add_shape(MSO_SHAPE.RIGHT_ARROW, left, top, width, Inches(0.4))
-    arr.fill.solid()
-    arr.fill.fore_color.rgb = color
-    arr.line.fill.background()
+    arr = slide.shapes.add_shape(RIGHT_ARROW, left, top, width, ARROW_THICKNESS)
+    paint(arr._element, color)
     return arr
 
 
 def arrow_down(slide, left, top, height=Inches(0.6), color=MEDIUM_BLUE):
     """Draw a down arrow."""
-    arr = slide.shapes.add_shape(MSO_SHAPE.DOWN_ARROW, left, top, Inches(0.4), height)
-    arr.fill.solid()
-    arr.fill.fore_color.rgb = color
-    arr.line.fill.background()
+    arr = slide.shapes.add_shape(DOWN_ARROW, left, top, ARROW_THICKNESS, height)
+    paint(arr._element, color)
     return arr
 
 
 def card(slide, left, top, width, height, title, subtitle, bg_color, border_color, icon_text="", title_color=DARK_BLUE):
     """Create a visual card with optional icon."""
     box = add_shape(slide, left, top, width, height, bg_color, border_color)
-    y = top + Inches(0.15)
+    y = top + CARD_PAD
     if icon_text:
         add_text(slide, left, y, width, Inches(0.5), icon_text, size=24, align=PP_ALIGN.CENTER)
         y += Inches(0.5)
-    add_text(slide, left + Inches(0.15), y, width - Inches(0.3), Inches(0.4),
+    inner_left, inner_width = left + CARD_PAD, width - 2 * CARD_PAD
+    add_text(slide, inner_left, y, inner_width, Inches(0.4),
              title, size=14, bold=True, color=title_color, align=PP_ALIGN.CENTER)
     if subtitle:
-        add_text(slide, left + Inches(0.15), y + Inches(0.35), width - Inches(0.3), Inches(0.8),
+        add_text(slide, inner_left, y + Inches(0.35), inner_width, Inches(0.8),
                  subtitle, size=11, color=GRAY, align=PP_ALIGN.CENTER)
     return box
 
 
+def badge_card(slide, left, top, width, height, icon, icon_size, bg_color, border_color):
+    """Bordered card with a round icon badge centred at its top; callers add the text rows."""
+    box = add_shape(slide, left, top, width, height, bg_color, border_color)
+    circ = add_shape(slide, left + (width - BADGE_SIZE) // 2, top + Inches(0.2), BADGE_SIZE, BADGE_SIZE,
+                     border_color, shape_type=OVAL)
+    set_text(circ, icon, size=icon_size, align=PP_ALIGN.CENTER)
+    return box
+
+
+def content_slide(title):
+    """Start a white slide with the blue title header."""
+    slide = prs.slides.add_slide(BLANK_LAYOUT)
+    add_bg(slide, WHITE)
+    header_bar(slide, title)
+    return slide
+
+
+def section_slide(icon, icon_color, title, subtitle):
+    """Section divider: big round icon, section title and a one-line summary."""
+    slide = prs.slides.add_slide(BLANK_LAYOUT)
+    add_bg(slide, WHITE)
+    add_rect(slide, 0, 0, W, Inches(0.06), LIGHT_BLUE)
+
+    circ = add_shape(slide, Inches(5.667), Inches(1.5), Inches(2), Inches(2), icon_color, shape_type=OVAL)
+    set_text(circ, icon, size=48, align=PP_ALIGN.CENTER)
+
+    add_text(slide, Inches(1), Inches(3.8), Inches(11.333), Inches(1),
+             title, size=36, bold=True, color=DARK_BLUE, align=PP_ALIGN.CENTER)
+    add_text(slide, Inches(2), Inches(4.8), Inches(9.333), Inches(0.6),
+             subtitle, size=18, color=GRAY, align=PP_ALIGN.CENTER)
+    return slide
+
+
+# Every slide uses the blank layout; the white background and the footer bar
+# are drawn once on it. The title and closing slides paint their own dark
+# background and cover the footer with a wider bottom bar.
+BLANK_LAYOUT = prs.slide_layouts[6]
+BLANK_LAYOUT.background.fill.solid()
+BLANK_LAYOUT.background.fill.fore_color.rgb = WHITE
+footer_bar(BLANK_LAYOUT)
+
 # ═══════════════════════════════════════════════════════════════
 # SLIDE 1 — Title
 # ═══════════════════════════════════════════════════════════════
-slide = prs.slides.add_slide(prs.slide_layouts[6])
+slide = prs.slides.add_slide(BLANK_LAYOUT)
 add_bg(slide, DARK_BLUE)
 add_rect(slide, 0, 0, W, Inches(0.08), LIGHT_BLUE)
 
 # Big WiFi icon
-wifi = add_shape(slide, Inches(5.4), Inches(1.2), Inches(2.5), Inches(2.5), MEDIUM_BLUE, shape_type=MSO_SHAPE.OVAL)
+wifi = add_shape(slide, Inches(5.4), Inches(1.2), Inches(2.5), Inches(2.5), MEDIUM_BLUE, shape_type=OVAL)
 set_text(wifi, "📡", size=60, align=PP_ALIGN.CENTER)
 
 add_text(slide, Inches(1), Inches(3.9), Inches(11.333), Inches(1),
          "Portail Captif WiFi — UCAC-ICAM", size=40, bold=True, color=WHITE, align=PP_ALIGN.CENTER)
 add_text(slide, Inches(1), Inches(5), Inches(11.333), Inches(0.6),
-         "Projet de fin d'études — Janvier 2026", size=20, color=RGBColor(0xBF, 0xDB, 0xFE), align=PP_ALIGN.CENTER)
+         "Projet de fin d'études — Janvier 2026", size=20, color=SUBTITLE_BLUE, align=PP_ALIGN.CENTER)
 tf = add_text(slide, Inches(3), Inches(5.8), Inches(7.333), Inches(1),
-              "Auteur : Valerdy", size=16, color=RGBColor(0xBF, 0xDB, 0xFE), align=PP_ALIGN.CENTER)
+              "Auteur : Valerdy", size=16, color=SUBTITLE_BLUE, align=PP_ALIGN.CENTER)
 add_para(tf, "Encadrement technique avec Claude (Assistant IA)", size=14, color=GRAY, align=PP_ALIGN.CENTER)
 
 add_rect(slide, 0, Inches(7.42), W, Inches(0.08), LIGHT_BLUE)
@@ -176,18 +247,16 @@ add_rect(slide, 0, Inches(7.42), W, Inches(0.08), LIGHT_BLUE)
 # ═══════════════════════════════════════════════════════════════
 # SLIDE 2 — Sommaire visuel (icons grid)
 # ═══════════════════════════════════════════════════════════════
-slide = prs.slides.add_slide(prs.slide_layouts[6])
-add_bg(slide, WHITE)
-header_bar(slide, "Sommaire")
+slide = content_slide("Sommaire")
 
-sections = [
+sections = (
     ("🌐", "Architecture\nRéseau", LIGHT_BLUE, MEDIUM_BLUE),
     ("📡", "MikroTik\nHotspot", LIGHT_ORANGE, ORANGE),
     ("🔐", "FreeRADIUS\nAuthentification", LIGHT_GREEN, GREEN),
     ("🗄️", "PostgreSQL\nBase de données", LIGHT_PURPLE, PURPLE),
     ("⚡", "Flux\nComplet", LIGHT_TEAL, TEAL),
     ("🎯", "Conclusion", LIGHT_RED, RED),
-]
+)
 
 for i, (icon, label, bg, border) in enumerate(sections):
     col = i % 3
@@ -196,14 +265,10 @@ for i, (icon, label, bg, border) in enumerate(sections):
     top = Inches(1.8 + row * 2.8)
     card(slide, left, top, Inches(3.2), Inches(2.2), label, "", bg, border, icon_text=icon)
 
-footer_bar(slide)
-
 # ═══════════════════════════════════════════════════════════════
 # SLIDE 3 — Architecture réseau (grand diagramme visuel)
 # ═══════════════════════════════════════════════════════════════
-slide = prs.slides.add_slide(prs.slide_layouts[6])
-add_bg(slide, WHITE)
-header_bar(slide, "Architecture Réseau Globale")
+slide = content_slide("Architecture Réseau Globale")
 
 # Internet cloud at top center
 inet = add_shape(slide, Inches(5.2), Inches(1.3), Inches(3), Inches(1), LIGHT_ORANGE, ORANGE, MSO_SHAPE.CLOUD)
@@ -249,31 +314,16 @@ add_para(tf3, "Auth RADIUS (PAP/CHAP)", size=11, color=GRAY, align=PP_ALIGN.CENT
 add_text(slide, Inches(8.8), Inches(4.55), Inches(2.5), Inches(0.4),
          "◄── WiFi/DHCP ──►", size=11, bold=True, color=RED, align=PP_ALIGN.CENTER)
 
-footer_bar(slide)
-
 # ═══════════════════════════════════════════════════════════════
 # SLIDE 4 — Section MikroTik
 # ═══════════════════════════════════════════════════════════════
-slide = prs.slides.add_slide(prs.slide_layouts[6])
-add_bg(slide, WHITE)
-add_rect(slide, 0, 0, W, Inches(0.06), LIGHT_BLUE)
-
-circ = add_shape(slide, Inches(5.667), Inches(1.5), Inches(2), Inches(2), MEDIUM_BLUE, shape_type=MSO_SHAPE.OVAL)
-set_text(circ, "📡", size=48, align=PP_ALIGN.CENTER)
-
-add_text(slide, Inches(1), Inches(3.8), Inches(11.333), Inches(1),
-         "Configuration MikroTik", size=36, bold=True, color=DARK_BLUE, align=PP_ALIGN.CENTER)
-add_text(slide, Inches(2), Inches(4.8), Inches(9.333), Inches(0.6),
-         "Interfaces  •  DHCP  •  Hotspot  •  NAT  •  DNS  •  Sécurité", size=18, color=GRAY, align=PP_ALIGN.CENTER)
-
-footer_bar(slide)
+section_slide("📡", MEDIUM_BLUE, "Configuration MikroTik",
+              "Interfaces  •  DHCP  •  Hotspot  •  NAT  •  DNS  •  Sécurité")
 
 # ═══════════════════════════════════════════════════════════════
 # SLIDE 5 — MikroTik Interfaces (visual diagram)
 # ═══════════════════════════════════════════════════════════════
-slide = prs.slides.add_slide(prs.slide_layouts[6])
-add_bg(slide, WHITE)
-header_bar(slide, "MikroTik — Interfaces et Adressage IP")
+slide = content_slide("MikroTik — Interfaces et Adressage IP")
 
 # Central router box
 router = add_shape(slide, Inches(4.5), Inches(2.5), Inches(4.3), Inches(2.5), ACCENT_BLUE, MEDIUM_BLUE)
@@ -319,28 +369,24 @@ add_text(slide, Inches(3.5), Inches(6.05), Inches(6.3), Inches(0.4),
 # Arrow bridge -> pool
 arrow_down(slide, Inches(6.5), Inches(4.8), Inches(0.6), PURPLE)
 
-footer_bar(slide)
-
 # ═══════════════════════════════════════════════════════════════
 # SLIDE 6 — DHCP (visual flow)
 # ═══════════════════════════════════════════════════════════════
-slide = prs.slides.add_slide(prs.slide_layouts[6])
-add_bg(slide, WHITE)
-header_bar(slide, "MikroTik — Serveur DHCP")
+slide = content_slide("MikroTik — Serveur DHCP")
 
 # DHCP flow: 4 steps horizontally
-steps = [
+steps = (
     ("1", "📱 Client\nse connecte", "Le client WiFi\nrejoint le réseau", LIGHT_BLUE, MEDIUM_BLUE),
     ("2", "📨 DHCP\nDiscover", "Demande d'adresse\nIP (broadcast)", LIGHT_ORANGE, ORANGE),
     ("3", "📡 DHCP\nOffer", "Le routeur propose\nune IP du pool", LIGHT_GREEN, GREEN),
     ("4", "✅ IP\nAttribuée", "10.242.18.x\nGateway + DNS", LIGHT_PURPLE, PURPLE),
-]
+)
 
 for i, (num, title, desc, bg, border) in enumerate(steps):
     left = Inches(0.5 + i * 3.2)
     top = Inches(1.6)
     # Number circle
-    circ = add_shape(slide, left + Inches(1), top, Inches(0.7), Inches(0.7), border, shape_type=MSO_SHAPE.OVAL)
+    circ = add_shape(slide, left + Inches(1), top, Inches(0.7), Inches(0.7), border, shape_type=OVAL)
     set_text(circ, num, size=20, bold=True, color=WHITE, align=PP_ALIGN.CENTER)
     # Card
     box = add_shape(slide, left, top + Inches(0.9), Inches(2.7), Inches(2.0), bg, border)
@@ -360,29 +406,25 @@ tf = add_text(slide, Inches(1.3), Inches(6.05), Inches(10.7), Inches(0.6),
               "Pool : dhcp-pool  •  Plage : .100 à .200  •  Interface : bridge-LAN  •  Réseau : 10.242.18.0/24",
               size=13, color=GRAY, align=PP_ALIGN.CENTER)
 
-footer_bar(slide)
-
 # ═══════════════════════════════════════════════════════════════
 # SLIDE 7 — Hotspot (visual flow)
 # ═══════════════════════════════════════════════════════════════
-slide = prs.slides.add_slide(prs.slide_layouts[6])
-add_bg(slide, WHITE)
-header_bar(slide, "MikroTik — Principe du Hotspot")
+slide = content_slide("MikroTik — Principe du Hotspot")
 
 # Visual: Client -> Redirect -> Login -> RADIUS -> Internet
-steps_h = [
+steps_h = (
     ("📱", "Client WiFi", "Connexion au\nréseau UCAC", LIGHT_BLUE, MEDIUM_BLUE),
     ("🔄", "Redirection", "Trafic HTTP\nintercepté", LIGHT_ORANGE, ORANGE),
     ("🔑", "Page Login", "wifi.ucac-icam.cm\n/login", LIGHT_PURPLE, PURPLE),
     ("🔐", "RADIUS", "Vérification\ncredentials", LIGHT_GREEN, GREEN),
     ("🌐", "Internet", "Accès autorisé\navec QoS", LIGHT_TEAL, TEAL),
-]
+)
 
 for i, (icon, title, desc, bg, border) in enumerate(steps_h):
     left = Inches(0.3 + i * 2.6)
     top = Inches(1.5)
     # Icon circle
-    circ = add_shape(slide, left + Inches(0.6), top, Inches(1.2), Inches(1.2), border, shape_type=MSO_SHAPE.OVAL)
+    circ = add_shape(slide, left + Inches(0.6), top, Inches(1.2), Inches(1.2), border, shape_type=OVAL)
     set_text(circ, icon, size=32, align=PP_ALIGN.CENTER)
     # Label
     add_text(slide, left, top + Inches(1.3), Inches(2.4), Inches(0.5),
@@ -416,14 +458,10 @@ add_para(tf2, "• Page de login personnalisée", size=13, color=BLACK)
 add_para(tf2, "", size=8, color=BLACK)
 add_para(tf2, "Le hotspot crée auto. les règles\nfirewall, NAT et queues", size=12, color=GRAY)
 
-footer_bar(slide)
-
 # ═══════════════════════════════════════════════════════════════
 # SLIDE 8 — NAT Masquerade (visual diagram)
 # ═══════════════════════════════════════════════════════════════
-slide = prs.slides.add_slide(prs.slide_layouts[6])
-add_bg(slide, WHITE)
-header_bar(slide, "MikroTik — NAT Masquerade")
+slide = content_slide("MikroTik — NAT Masquerade")
 
 # Visual: Private IP -> Router (NAT) -> Public IP -> Internet
 # Client
@@ -474,14 +512,10 @@ add_text(slide, Inches(1.7), Inches(5.9), Inches(9.9), Inches(0.7),
          "Sans NAT, les clients en 10.242.18.x ne peuvent pas accéder à Internet. Le masquerade remplace l'IP source privée par l'IP publique du routeur.",
          size=13, color=GRAY, align=PP_ALIGN.CENTER)
 
-footer_bar(slide)
-
 # ═══════════════════════════════════════════════════════════════
 # SLIDE 9 — DNS & Sécurité (visual)
 # ═══════════════════════════════════════════════════════════════
-slide = prs.slides.add_slide(prs.slide_layouts[6])
-add_bg(slide, WHITE)
-header_bar(slide, "MikroTik — DNS et Sécurité")
+slide = content_slide("MikroTik — DNS et Sécurité")
 
 # Left: DNS Configuration
 dns_box = add_shape(slide, Inches(0.5), Inches(1.4), Inches(6), Inches(2.8), LIGHT_BLUE, MEDIUM_BLUE)
@@ -521,52 +555,34 @@ tf4 = add_text(slide, Inches(7.1), Inches(5.15), Inches(5.5), Inches(1.5),
 add_para(tf4, "• Agent Node.js dédié", size=13, color=BLACK)
 add_para(tf4, "• Communication backend ↔ routeur", size=13, color=BLACK)
 
-footer_bar(slide)
-
 # ═══════════════════════════════════════════════════════════════
 # SLIDE 10 — Section FreeRADIUS
 # ═══════════════════════════════════════════════════════════════
-slide = prs.slides.add_slide(prs.slide_layouts[6])
-add_bg(slide, WHITE)
-add_rect(slide, 0, 0, W, Inches(0.06), LIGHT_BLUE)
-
-circ = add_shape(slide, Inches(5.667), Inches(1.5), Inches(2), Inches(2), GREEN, shape_type=MSO_SHAPE.OVAL)
-set_text(circ, "🔐", size=48, align=PP_ALIGN.CENTER)
-
-add_text(slide, Inches(1), Inches(3.8), Inches(11.333), Inches(1),
-         "Configuration FreeRADIUS", size=36, bold=True, color=DARK_BLUE, align=PP_ALIGN.CENTER)
-add_text(slide, Inches(2), Inches(4.8), Inches(9.333), Inches(0.6),
-         "Serveur AAA  •  Authentication  •  Authorization  •  Accounting", size=18, color=GRAY, align=PP_ALIGN.CENTER)
-
-footer_bar(slide)
+section_slide("🔐", GREEN, "Configuration FreeRADIUS",
+              "Serveur AAA  •  Authentication  •  Authorization  •  Accounting")
 
 # ═══════════════════════════════════════════════════════════════
 # SLIDE 11 — FreeRADIUS AAA (3 colonnes visuelles)
 # ═══════════════════════════════════════════════════════════════
-slide = prs.slides.add_slide(prs.slide_layouts[6])
-add_bg(slide, WHITE)
-header_bar(slide, "FreeRADIUS — Authentification, Autorisation, Accounting")
+slide = content_slide("FreeRADIUS — Authentification, Autorisation, Accounting")
 
 # 3 big cards for A, A, A
-aaa = [
+aaa = (
     ("🔑", "Authentication", "Vérifier l'identité",
-     ["Username + Password", "Table radcheck (PostgreSQL)", "Statut actif vérifié", "PAP / CHAP supportés"],
+     ("Username + Password", "Table radcheck (PostgreSQL)", "Statut actif vérifié", "PAP / CHAP supportés"),
      LIGHT_GREEN, GREEN),
     ("📋", "Authorization", "Définir les droits",
-     ["Bande passante (Rate-Limit)", "Durée session (Timeout)", "Tables radreply + radgroupreply", "Ex: 5M/10M, 8h session"],
+     ("Bande passante (Rate-Limit)", "Durée session (Timeout)", "Tables radreply + radgroupreply", "Ex: 5M/10M, 8h session"),
      LIGHT_BLUE, MEDIUM_BLUE),
     ("📊", "Accounting", "Tracer l'activité",
-     ["Sessions : début, durée, fin", "Octets transférés (up/down)", "Table radacct", "Mise à jour toutes les 5 min"],
+     ("Sessions : début, durée, fin", "Octets transférés (up/down)", "Table radacct", "Mise à jour toutes les 5 min"),
      LIGHT_PURPLE, PURPLE),
-]
+)
 
 for i, (icon, title, subtitle, items, bg, border) in enumerate(aaa):
     left = Inches(0.4 + i * 4.3)
     top = Inches(1.4)
-    box = add_shape(slide, left, top, Inches(3.8), Inches(5.5), bg, border)
-    # Icon
-    circ = add_shape(slide, left + Inches(1.3), top + Inches(0.2), Inches(1.2), Inches(1.2), border, shape_type=MSO_SHAPE.OVAL)
-    set_text(circ, icon, size=30, align=PP_ALIGN.CENTER)
+    badge_card(slide, left, top, Inches(3.8), Inches(5.5), icon, 30, bg, border)
     # Title
     add_text(slide, left + Inches(0.2), top + Inches(1.5), Inches(3.4), Inches(0.5),
              title, size=18, bold=True, color=DARK_BLUE, align=PP_ALIGN.CENTER)
@@ -579,29 +595,25 @@ for i, (icon, title, subtitle, items, bg, border) in enumerate(aaa):
                  "•  " + item, size=12, color=BLACK, align=PP_ALIGN.LEFT)
         y += Inches(0.35)
 
-footer_bar(slide)
-
 # ═══════════════════════════════════════════════════════════════
 # SLIDE 12 — FreeRADIUS flux auth (visual flow)
 # ═══════════════════════════════════════════════════════════════
-slide = prs.slides.add_slide(prs.slide_layouts[6])
-add_bg(slide, WHITE)
-header_bar(slide, "FreeRADIUS — Flux d'Authentification")
+slide = content_slide("FreeRADIUS — Flux d'Authentification")
 
 # Vertical flow
-flow_steps = [
+flow_steps = (
     ("1", "📱 Client envoie credentials", "Page de login hotspot (HTTP-CHAP / HTTP-PAP)", LIGHT_BLUE, MEDIUM_BLUE),
     ("2", "📡 MikroTik → Access-Request", "User-Name, Password, NAS-IP, MAC  •  UDP 1812", LIGHT_ORANGE, ORANGE),
     ("3", "🔍 FreeRADIUS → authorize (SQL)", "SELECT FROM radcheck WHERE username=? AND statut=true", LIGHT_GREEN, GREEN),
     ("4", "🔑 FreeRADIUS → authenticate", "Comparaison mot de passe (PAP: clair, CHAP: MD5)", LIGHT_PURPLE, PURPLE),
-]
+)
 
 for i, (num, title, desc, bg, border) in enumerate(flow_steps):
     left_num = Inches(0.5)
     left_card = Inches(1.5)
     top = Inches(1.4 + i * 1.4)
     # Number circle
-    circ = add_shape(slide, left_num, top + Inches(0.1), Inches(0.7), Inches(0.7), border, shape_type=MSO_SHAPE.OVAL)
+    circ = add_shape(slide, left_num, top + Inches(0.1), Inches(0.7), Inches(0.7), border, shape_type=OVAL)
     set_text(circ, num, size=18, bold=True, color=WHITE, align=PP_ALIGN.CENTER)
     # Card
     box = add_shape(slide, left_card, top, Inches(7), Inches(1.0), bg, border)
@@ -627,21 +639,17 @@ tf_r = add_text(slide, Inches(9.2), Inches(4.9), Inches(3.4), Inches(0.6),
                 "Log dans radpostauth", size=12, color=BLACK)
 add_para(tf_r, "reply = 'Access-Reject'", size=11, color=GRAY)
 
-footer_bar(slide)
-
 # ═══════════════════════════════════════════════════════════════
 # SLIDE 13 — FreeRADIUS config files (visual cards)
 # ═══════════════════════════════════════════════════════════════
-slide = prs.slides.add_slide(prs.slide_layouts[6])
-add_bg(slide, WHITE)
-header_bar(slide, "FreeRADIUS — Fichiers de Configuration")
+slide = content_slide("FreeRADIUS — Fichiers de Configuration")
 
-files = [
+files = (
     ("📄", "clients.conf", "Client RADIUS (MikroTik)", "IP: 10.242.18.6\nSecret partagé\nnastype: other", LIGHT_ORANGE, ORANGE),
     ("🗃️", "mods-enabled/sql", "Driver PostgreSQL", "rlm_sql_postgresql\nlocalhost:5432\ncaptive_portal", LIGHT_GREEN, GREEN),
     ("⚙️", "sites-available/default", "Sites RADIUS", "Port 1812 (auth)\nPort 1813 (acct)\nPAP + CHAP", LIGHT_BLUE, MEDIUM_BLUE),
     ("📖", "dictionary.mikrotik", "Attributs MikroTik", "Vendor ID: 14988\nRate-Limit (ID 8)\nTotal-Limit...", LIGHT_PURPLE, PURPLE),
-]
+)
 
 for i, (icon, name, subtitle, desc, bg, border) in enumerate(files):
     col = i % 2
@@ -650,7 +658,7 @@ for i, (icon, name, subtitle, desc, bg, border) in enumerate(files):
     top = Inches(1.4 + row * 2.9)
     box = add_shape(slide, left, top, Inches(5.9), Inches(2.5), bg, border)
     # Icon
-    circ = add_shape(slide, left + Inches(0.3), top + Inches(0.3), Inches(0.9), Inches(0.9), border, shape_type=MSO_SHAPE.OVAL)
+    circ = add_shape(slide, left + Inches(0.3), top + Inches(0.3), Inches(0.9), Inches(0.9), border, shape_type=OVAL)
     set_text(circ, icon, size=22, align=PP_ALIGN.CENTER)
     # Title
     add_text(slide, left + Inches(1.5), top + Inches(0.3), Inches(4.1), Inches(0.4),
@@ -661,44 +669,29 @@ for i, (icon, name, subtitle, desc, bg, border) in enumerate(files):
     add_text(slide, left + Inches(1.5), top + Inches(1.2), Inches(4.1), Inches(1.2),
              desc, size=12, color=BLACK)
 
-footer_bar(slide)
-
 # ═══════════════════════════════════════════════════════════════
 # SLIDE 14 — Section PostgreSQL
 # ═══════════════════════════════════════════════════════════════
-slide = prs.slides.add_slide(prs.slide_layouts[6])
-add_bg(slide, WHITE)
-add_rect(slide, 0, 0, W, Inches(0.06), LIGHT_BLUE)
-
-circ = add_shape(slide, Inches(5.667), Inches(1.5), Inches(2), Inches(2), PURPLE, shape_type=MSO_SHAPE.OVAL)
-set_text(circ, "🗄️", size=48, align=PP_ALIGN.CENTER)
-
-add_text(slide, Inches(1), Inches(3.8), Inches(11.333), Inches(1),
-         "Configuration PostgreSQL", size=36, bold=True, color=DARK_BLUE, align=PP_ALIGN.CENTER)
-add_text(slide, Inches(2), Inches(4.8), Inches(9.333), Inches(0.6),
-         "Base de données captive_portal  •  Tables RADIUS  •  Tables Django", size=18, color=GRAY, align=PP_ALIGN.CENTER)
-
-footer_bar(slide)
+section_slide("🗄️", PURPLE, "Configuration PostgreSQL",
+              "Base de données captive_portal  •  Tables RADIUS  •  Tables Django")
 
 # ═══════════════════════════════════════════════════════════════
 # SLIDE 15 — PostgreSQL tables (visual schema)
 # ═══════════════════════════════════════════════════════════════
-slide = prs.slides.add_slide(prs.slide_layouts[6])
-add_bg(slide, WHITE)
-header_bar(slide, "PostgreSQL — Schéma des Tables")
+slide = content_slide("PostgreSQL — Schéma des Tables")
 
 # Left: RADIUS tables
 add_text(slide, Inches(0.5), Inches(1.3), Inches(6), Inches(0.5),
          "🔐 Tables RADIUS (FreeRADIUS)", size=16, bold=True, color=GREEN, align=PP_ALIGN.CENTER)
 
-radius_tables = [
+radius_tables = (
     ("radcheck", "Auth: username, password, statut"),
     ("radreply", "Réponse: attributs individuels"),
     ("radusergroup", "Liens utilisateur → groupe"),
     ("radgroupreply", "Réponse par groupe (QoS)"),
     ("radacct", "Sessions: durée, octets, MAC"),
     ("radpostauth", "Journal des authentifications"),
-]
+)
 
 for i, (name, desc) in enumerate(radius_tables):
     top = Inches(1.85 + i * 0.82)
@@ -712,14 +705,14 @@ for i, (name, desc) in enumerate(radius_tables):
 add_text(slide, Inches(6.9), Inches(1.3), Inches(6), Inches(0.5),
          "🖥️ Tables Django (Gestion)", size=16, bold=True, color=PURPLE, align=PP_ALIGN.CENTER)
 
-django_tables = [
+django_tables = (
     ("core_user", "Utilisateurs (extends AbstractUser)"),
     ("core_profile", "Profils (quotas, bande passante)"),
     ("core_promotion", "Groupes (classes, départements)"),
     ("core_userquota", "Quotas utilisateurs"),
     ("core_blockedsite", "Sites bloqués (DNS)"),
     ("mikrotik_config", "Config routeur MikroTik"),
-]
+)
 
 for i, (name, desc) in enumerate(django_tables):
     top = Inches(1.85 + i * 0.82)
@@ -733,31 +726,25 @@ for i, (name, desc) in enumerate(django_tables):
 add_text(slide, Inches(4.5), Inches(7.0), Inches(4.3), Inches(0.4),
          "◄── Synchronisation Django ↔ RADIUS ──►", size=12, bold=True, color=MEDIUM_BLUE, align=PP_ALIGN.CENTER)
 
-footer_bar(slide)
-
 # ═══════════════════════════════════════════════════════════════
 # SLIDE 16 — PostgreSQL ↔ FreeRADIUS link (visual)
 # ═══════════════════════════════════════════════════════════════
-slide = prs.slides.add_slide(prs.slide_layouts[6])
-add_bg(slide, WHITE)
-header_bar(slide, "PostgreSQL — Lien FreeRADIUS ↔ Django")
+slide = content_slide("PostgreSQL — Lien FreeRADIUS ↔ Django")
 
 # 3 phases as visual flow
-phases = [
+phases = (
     ("🔍", "Authorize", "Vérification", "SELECT FROM radcheck\nWHERE username=?\nAND statut=true",
      LIGHT_GREEN, GREEN),
     ("📝", "Post-Auth", "Journalisation", "INSERT INTO radpostauth\n(username, reply, authdate)\nSuccès ou Rejet",
      LIGHT_ORANGE, ORANGE),
     ("📊", "Accounting", "Comptabilité", "Start → INSERT radacct\nInterim → UPDATE octets\nStop → UPDATE fin session",
      LIGHT_BLUE, MEDIUM_BLUE),
-]
+)
 
 for i, (icon, title, subtitle, desc, bg, border) in enumerate(phases):
     left = Inches(0.4 + i * 4.3)
     top = Inches(1.4)
-    box = add_shape(slide, left, top, Inches(3.8), Inches(3.5), bg, border)
-    circ = add_shape(slide, left + Inches(1.3), top + Inches(0.2), Inches(1.2), Inches(1.2), border, shape_type=MSO_SHAPE.OVAL)
-    set_text(circ, icon, size=28, align=PP_ALIGN.CENTER)
+    badge_card(slide, left, top, Inches(3.8), Inches(3.5), icon, 28, bg, border)
     add_text(slide, left + Inches(0.2), top + Inches(1.5), Inches(3.4), Inches(0.5),
              title, size=16, bold=True, color=DARK_BLUE, align=PP_ALIGN.CENTER)
     add_text(slide, left + Inches(0.2), top + Inches(1.95), Inches(3.4), Inches(0.35),
@@ -774,17 +761,13 @@ tf = add_text(slide, Inches(1.5), Inches(5.95), Inches(10.3), Inches(0.8),
 add_para(tf, "Profil modifié → Django met à jour radgroupreply + radgroupcheck  •  Retry automatique en cas d'échec",
          size=12, color=GRAY, align=PP_ALIGN.CENTER)
 
-footer_bar(slide)
-
 # ═══════════════════════════════════════════════════════════════
 # SLIDE 17 — Flux complet (grand diagramme)
 # ═══════════════════════════════════════════════════════════════
-slide = prs.slides.add_slide(prs.slide_layouts[6])
-add_bg(slide, WHITE)
-header_bar(slide, "Flux d'Authentification Complet")
+slide = content_slide("Flux d'Authentification Complet")
 
 # 8 steps in a visual flow (2 rows of 4)
-steps_flow = [
+steps_flow = (
     ("1", "📱", "Connexion WiFi", "IP via DHCP\n10.242.18.x", LIGHT_BLUE, MEDIUM_BLUE),
     ("2", "🔄", "Redirection", "HTTP intercepté\n→ page login", LIGHT_ORANGE, ORANGE),
     ("3", "🔑", "Saisie credentials", "Username +\nPassword", LIGHT_PURPLE, PURPLE),
@@ -793,7 +776,7 @@ steps_flow = [
     ("6", "✅", "Access-Accept", "Rate-Limit\nTimeout", LIGHT_GREEN, GREEN),
     ("7", "🌐", "Accès Internet", "QoS appliquée\n5M/10M", LIGHT_BLUE, MEDIUM_BLUE),
     ("8", "📊", "Accounting", "Sessions radacct\nToutes les 5 min", LIGHT_ORANGE, ORANGE),
-]
+)
 
 for i, (num, icon, title, desc, bg, border) in enumerate(steps_flow):
     row = i // 4
@@ -803,7 +786,7 @@ for i, (num, icon, title, desc, bg, border) in enumerate(steps_flow):
     # Card
     box = add_shape(slide, left, top, Inches(2.8), Inches(2.5), bg, border)
     # Number
-    circ = add_shape(slide, left + Inches(0.1), top + Inches(0.1), Inches(0.5), Inches(0.5), border, shape_type=MSO_SHAPE.OVAL)
+    circ = add_shape(slide, left + Inches(0.1), top + Inches(0.1), Inches(0.5), Inches(0.5), border, shape_type=OVAL)
     set_text(circ, num, size=14, bold=True, color=WHITE, align=PP_ALIGN.CENTER)
     # Icon
     add_text(slide, left, top + Inches(0.15), Inches(2.8), Inches(0.5),
@@ -821,29 +804,23 @@ for i, (num, icon, title, desc, bg, border) in enumerate(steps_flow):
 # Arrow from row 1 to row 2 (down)
 arrow_down(slide, Inches(12.25), Inches(3.95), Inches(0.4), TEAL)
 
-footer_bar(slide)
-
 # ═══════════════════════════════════════════════════════════════
 # SLIDE 18 — Conclusion (visual summary)
 # ═══════════════════════════════════════════════════════════════
-slide = prs.slides.add_slide(prs.slide_layouts[6])
-add_bg(slide, WHITE)
-header_bar(slide, "Conclusion")
+slide = content_slide("Conclusion")
 
-components = [
+components = (
     ("📡", "MikroTik", "Hotspot • NAT • DHCP\nDNS • Client RADIUS", LIGHT_ORANGE, ORANGE),
     ("🔐", "FreeRADIUS", "Serveur AAA central\nPAP/CHAP via SQL", LIGHT_GREEN, GREEN),
     ("🗄️", "PostgreSQL", "Tables RADIUS + Django\nUtilisateurs & Sessions", LIGHT_PURPLE, PURPLE),
     ("⚙️", "Django REST", "API de gestion\nSync RADIUS & MikroTik", LIGHT_BLUE, MEDIUM_BLUE),
     ("🖥️", "Vue.js 3", "Dashboard admin\nTemps réel", LIGHT_TEAL, TEAL),
-]
+)
 
 for i, (icon, title, desc, bg, border) in enumerate(components):
     left = Inches(0.3 + i * 2.6)
     top = Inches(1.5)
-    box = add_shape(slide, left, top, Inches(2.3), Inches(3.0), bg, border)
-    circ = add_shape(slide, left + Inches(0.55), top + Inches(0.2), Inches(1.2), Inches(1.2), border, shape_type=MSO_SHAPE.OVAL)
-    set_text(circ, icon, size=30, align=PP_ALIGN.CENTER)
+    badge_card(slide, left, top, Inches(2.3), Inches(3.0), icon, 30, bg, border)
     add_text(slide, left + Inches(0.1), top + Inches(1.5), Inches(2.1), Inches(0.4),
              title, size=14, bold=True, color=DARK_BLUE, align=PP_ALIGN.CENTER)
     add_text(slide, left + Inches(0.1), top + Inches(1.95), Inches(2.1), Inches(0.8),
@@ -857,19 +834,17 @@ add_text(slide, Inches(1.7), Inches(5.65), Inches(9.9), Inches(0.9),
          "Un système WiFi sécurisé, évolutif et adapté au contexte universitaire UCAC-ICAM\nOrchestration Docker Compose de 11 services",
          size=15, color=GRAY, align=PP_ALIGN.CENTER)
 
-footer_bar(slide)
-
 # ═══════════════════════════════════════════════════════════════
 # SLIDE 19 — Merci
 # ═══════════════════════════════════════════════════════════════
-slide = prs.slides.add_slide(prs.slide_layouts[6])
+slide = prs.slides.add_slide(BLANK_LAYOUT)
 add_bg(slide, DARK_BLUE)
 add_rect(slide, 0, 0, W, Inches(0.08), LIGHT_BLUE)
 
 add_text(slide, Inches(1), Inches(2.5), Inches(11.333), Inches(1.2),
          "Merci pour votre attention", size=44, bold=True, color=WHITE, align=PP_ALIGN.CENTER)
 add_text(slide, Inches(1), Inches(3.8), Inches(11.333), Inches(0.8),
-         "Questions ?", size=28, color=RGBColor(0xBF, 0xDB, 0xFE), align=PP_ALIGN.CENTER)
+         "Questions ?", size=28, color=SUBTITLE_BLUE, align=PP_ALIGN.CENTER)
 
 add_text(slide, Inches(3), Inches(5.5), Inches(7.333), Inches(0.5),
          "Portail Captif WiFi — UCAC-ICAM — Janvier 2026", size=14, color=GRAY, align=PP_ALIGN.CENTER)
@@ -878,6 +853,10 @@ add_rect(slide, 0, Inches(7.42), W, Inches(0.08), LIGHT_BLUE)
 
 # Save
 output_path = "/home/user/captive-portal/Presentation_Portail_Captif_UCAC_ICAM.pptx"
-prs.save(output_path)
+# Assemble the archive in memory, then hand it to the OS in a single write
+buf = BytesIO()
+prs.save(buf)
+with open(output_path, "wb") as f:
+    f.write(buf.getbuffer())
 print(f"Presentation saved to: {output_path}")
 print(f"Total slides: {len(prs.slides)}")
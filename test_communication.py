@@ -7,12 +7,26 @@ Vérifie que le backend Django répond correctement aux requêtes du frontend
 import requests
 import json
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # Configuration
 BACKEND_URL = "http://localhost:8000"
 TIMEOUT = 5  # secondes
 
+# Session partagée par les tests séquentiels : la connexion HTTP est réutilisée (keep-alive)
+session = requests.Session()
+
+# requests.Session n'est pas thread-safe : une session par thread pour les sondes parallèles
+_thread_sessions = threading.local()
+
+def thread_session():
+    """Retourne la session HTTP propre au thread courant"""
+    if not hasattr(_thread_sessions, 'session'):
+        _thread_sessions.session = requests.Session()
+    return _thread_sessions.session
+
 # Couleurs pour l'affichage
 GREEN = '\033[92m'
 RED = '\033[91m'
@@ -20,11 +34,12 @@ YELLOW = '\033[93m'
 BLUE = '\033[94m'
 RESET = '\033[0m'
 
+# Filet horizontal des titres de section, construit une seule fois
+RULE = f"{BLUE}{'='*60}{RESET}"
+
 def print_section(title):
     """Affiche un titre de section"""
-    print(f"\n{BLUE}{'='*60}{RESET}")
-    print(f"{BLUE}{title.center(60)}{RESET}")
-    print(f"{BLUE}{'='*60}{RESET}\n")
+    print(f"\n{RULE}\n{BLUE}{title.center(60)}{RESET}\n{RULE}\n")
 
 def print_success(message):
     """Affiche un message de succès"""
@@ -47,7 +62,7 @@ def test_backend_alive():
     print_section("TEST 1: Backend Accessible")
 
     try:
-        response = requests.get(f"{BACKEND_URL}/admin/", timeout=TIMEOUT)
+        response = session.get(f"{BACKEND_URL}/admin/", timeout=TIMEOUT)
         if response.status_code in [200, 302]:
             print_success(f"Backend accessible à {BACKEND_URL}")
             return True
@@ -77,7 +92,7 @@ def test_cors_headers():
         }
 
         # OPTIONS request (preflight)
-        response = requests.options(f"{BACKEND_URL}/api/core/auth/register/",
+        response = session.options(f"{BACKEND_URL}/api/core/auth/register/",
                                    headers=headers,
                                    timeout=TIMEOUT)
 
@@ -118,16 +133,21 @@ def test_api_endpoints():
         ('/api/core/vouchers/', 'GET', 'Vouchers'),
     ]
 
+    def probe(endpoint, method):
+        url = f"{BACKEND_URL}{endpoint}"
+        json_body = {} if method == 'POST' else None
+        return thread_session().request(method, url, json=json_body, timeout=TIMEOUT)
+
+    # Les requêtes sont indépendantes : on les envoie en parallèle,
+    # puis on affiche les résultats dans l'ordre de la liste
+    with ThreadPoolExecutor(max_workers=len(endpoints)) as executor:
+        futures = [executor.submit(probe, endpoint, method) for endpoint, method, _ in endpoints]
+
     results = []
 
-    for endpoint, method, description in endpoints:
+    for (endpoint, method, description), future in zip(endpoints, futures):
         try:
-            url = f"{BACKEND_URL}{endpoint}"
-
-            if method == 'GET':
-                response = requests.get(url, timeout=TIMEOUT)
-            elif method == 'POST':
-                response = requests.post(url, json={}, timeout=TIMEOUT)
+            response = future.result()
 
             # Pour les endpoints protégés, 401 est acceptable (non authentifié)
             # Pour les endpoints publics, 200 ou 400 est acceptable
@@ -166,7 +186,7 @@ def test_authentication_flow():
             "last_name": "User"
         }
 
-        response = requests.post(
+        response = session.post(
             f"{BACKEND_URL}/api/core/auth/register/",
             json=register_data,
             timeout=TIMEOUT
@@ -184,7 +204,7 @@ def test_authentication_flow():
 
                 # 2. Tester une requête authentifiée
                 headers = {'Authorization': f'Bearer {access_token}'}
-                profile_response = requests.get(
+                profile_response = session.get(
                     f"{BACKEND_URL}/api/core/profile/",
                     headers=headers,
                     timeout=TIMEOUT
@@ -247,7 +267,7 @@ def main():
         status = f"{GREEN}✅ PASSÉ{RESET}" if result else f"{RED}❌ ÉCHOUÉ{RESET}"
         print(f"{test_name}: {status}")
 
-    print(f"\n{BLUE}{'='*60}{RESET}")
+    print(f"\n{RULE}")
     percentage = (passed / total) * 100
 
     if percentage == 100: